@@ -0,0 +1,567 @@
+"""
+Unit tests for the RunwayML API clients.
+
+HTTP traffic is mocked; image tests use small temporary files.
+"""
+
+import base64
+import io
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from video_gen.providers import runway_generator
+from video_gen.providers.runway_provider.aleph_client import RunwayAlephClient
+from video_gen.providers.runway_provider.config import RunwayConfig
+from video_gen.providers.runway_provider.encoding import (
+    compress_jpeg,
+    downscale_to_frame,
+    encode_buffer_data_uri,
+    save_jpeg,
+)
+from video_gen.providers.runway_provider.gen4_client import RunwayGen4Client
+from video_gen.providers.runway_provider.image_cache import clear_image_cache
+from video_gen.providers.runway_provider.veo3_client import RunwayVeoClient
+
+
+class TestRunwayImageCache(unittest.TestCase):
+    """Test reuse of encoded reference images."""
+
+    def setUp(self):
+        clear_image_cache()
+        self.client = RunwayGen4Client(RunwayConfig(api_key="rk_test_123"))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.image_path = os.path.join(self.tmp.name, "frame.png")
+        with open(self.image_path, "wb") as f:
+            f.write(b"\x89PNG fake image bytes")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        clear_image_cache()
+
+    def test_unchanged_file_is_encoded_once(self):
+        with patch.object(
+            RunwayGen4Client, "_encode_original_image", autospec=True, return_value="data:image/png;base64,AAAA"
+        ) as mock_encode:
+            first = self.client._encode_image_to_base64(self.image_path)
+            second = self.client._encode_image_to_base64(self.image_path)
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_encode.call_count, 1)
+
+    def test_modified_file_is_re_encoded(self):
+        first = self.client._encode_image_to_base64(self.image_path)
+        with open(self.image_path, "wb") as f:
+            f.write(b"\x89PNG different, longer image bytes")
+
+        second = self.client._encode_image_to_base64(self.image_path)
+
+        self.assertNotEqual(first, second)
+
+    def test_cache_miss_stats_file_once(self):
+        with patch("video_gen.providers.runway_provider.image_cache.os.stat", wraps=os.stat) as mock_stat, \
+                patch("pathlib.Path.stat", autospec=True) as mock_path_stat:
+            self.client._encode_image_to_base64(self.image_path)
+
+        image_stats = [c for c in mock_stat.call_args_list if c.args[0] == self.image_path]
+        self.assertEqual(len(image_stats), 1)
+        mock_path_stat.assert_not_called()
+
+    def test_missing_file_still_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            self.client._encode_image_to_base64(os.path.join(self.tmp.name, "missing.png"))
+
+
+class TestRunwayImageEncoding(unittest.TestCase):
+    """Test chunked data URI encoding of reference images."""
+
+    def test_file_encoding_matches_one_shot_encoding(self):
+        clear_image_cache()
+        client = RunwayGen4Client(RunwayConfig(api_key="rk_test_123"))
+        # Longer than one encode chunk and not a multiple of 3
+        payload = os.urandom(3 * 64 * 1024 + 1001)
+        with tempfile.TemporaryDirectory() as tmp:
+            image_path = os.path.join(tmp, "frame.png")
+            with open(image_path, "wb") as f:
+                f.write(payload)
+
+            data_uri = client._encode_image_to_base64(image_path)
+
+        self.assertEqual(data_uri, "data:image/png;base64," + base64.b64encode(payload).decode("ascii"))
+
+    def test_buffer_encoding_matches_one_shot_encoding(self):
+        payload = os.urandom(3 * 64 * 1024 * 2 + 2)
+
+        data_uri = encode_buffer_data_uri(io.BytesIO(payload), "image/jpeg")
+
+        self.assertEqual(data_uri, b"data:image/jpeg;base64," + base64.b64encode(payload))
+
+    def test_opaque_alpha_dropped_without_compositing(self):
+        client = RunwayGen4Client(RunwayConfig(api_key="rk_test_123"))
+        pil_image = MagicMock()
+        img = MagicMock(mode="RGBA")
+        img.getchannel.return_value.getextrema.return_value = (255, 255)
+
+        self.assertIs(client._convert_to_rgb(img, pil_image), img.convert.return_value)
+        img.convert.assert_called_once_with("RGB")
+        pil_image.new.assert_not_called()
+
+    def test_transparent_alpha_composited_on_white(self):
+        client = RunwayGen4Client(RunwayConfig(api_key="rk_test_123"))
+        pil_image = MagicMock()
+        img = MagicMock(mode="RGBA")
+        img.getchannel.return_value.getextrema.return_value = (0, 255)
+
+        self.assertIs(client._convert_to_rgb(img, pil_image), pil_image.new.return_value)
+        pil_image.new.return_value.paste.assert_called_once_with(img, mask=img.getchannel.return_value)
+
+    def test_jpeg_input_repacked_at_original_quality_when_it_fits(self):
+        client = RunwayGen4Client(RunwayConfig(api_key="rk_test_123"))
+        pil_image = MagicMock()
+        img = pil_image.open.return_value
+        img.format = "JPEG"
+        img.width, img.height = 1920, 1080
+        img.info = {}
+        img.save.side_effect = lambda buffer, **kwargs: buffer.write(b"\xff\xd8 repacked")
+
+        data_uri = client._compress_and_encode_image(Path("photo.jpg"), 900, 800, pil_image)
+
+        self.assertEqual(data_uri, "data:image/jpeg;base64," + base64.b64encode(b"\xff\xd8 repacked").decode("ascii"))
+        self.assertEqual(img.save.call_args.kwargs["quality"], "keep")
+        img.convert.assert_not_called()
+
+    def test_large_jpeg_downscaled_before_first_decode(self):
+        client = RunwayGen4Client(RunwayConfig(api_key="rk_test_123"))
+        pil_image = MagicMock()
+        img = pil_image.open.return_value
+        img.format = "JPEG"
+        img.mode = "RGB"
+        img.width, img.height = 4032, 3024
+        calls = []
+        img.thumbnail.side_effect = lambda *args, **kwargs: calls.append("thumbnail")
+
+        def save(buffer, quality, **kwargs):
+            calls.append(quality)
+            buffer.write(b"\xff\xd8 small")
+
+        img.save.side_effect = save
+
+        client._compress_and_encode_image(Path("phone.jpg"), 3000, 800, pil_image)
+
+        # Shrinking must come first so Pillow can draft the decode
+        self.assertEqual(calls, ["thumbnail", 85])
+
+    def test_oversized_image_downscaled_to_frame(self):
+        pil_image = MagicMock()
+        for size, box in [((3840, 2160), (1920, 1080)), ((3024, 4032), (1080, 1920))]:
+            img = MagicMock(width=size[0], height=size[1])
+            self.assertTrue(downscale_to_frame(img, pil_image))
+            img.thumbnail.assert_called_once_with(box, pil_image.Resampling.BILINEAR, reducing_gap=1.0)
+
+        img = MagicMock(width=2560, height=1440)
+        self.assertFalse(downscale_to_frame(img, pil_image))
+        img.thumbnail.assert_not_called()
+
+    def test_jpeg_quality_predicted_from_two_probes(self):
+        # Stand-in for a PIL image whose JPEG size grows linearly with quality
+        img = MagicMock()
+        img.save.side_effect = lambda buffer, quality, **kwargs: buffer.write(b"\0" * quality * 100)
+
+        buffer, quality = compress_jpeg(img, max_size_kb=6800 / 1024)
+
+        self.assertEqual(quality, 68)
+        self.assertEqual(buffer.tell(), 6800)
+        self.assertEqual([c.kwargs["quality"] for c in img.save.call_args_list], [85, 45, 68])
+
+    def test_reused_jpeg_buffer_holds_only_the_new_image(self):
+        img = MagicMock()
+        img.save.side_effect = lambda buffer, quality, **kwargs: buffer.write(b"\0" * quality * 100)
+        buffer = save_jpeg(img, 85)
+
+        self.assertIs(save_jpeg(img, 45, buffer), buffer)
+        self.assertEqual(len(buffer.getvalue()), 4500)
+
+    def test_saved_jpeg_subsampled_and_optimized_with_mozjpeg(self):
+        img = MagicMock()
+        img.save.side_effect = lambda buffer, quality, **kwargs: buffer.write(b"\0" * 1000)
+        mozjpeg = MagicMock()
+        mozjpeg.optimize.return_value = b"\0" * 900
+
+        with patch("video_gen.providers.runway_provider.encoding.mozjpeg_lossless_optimization", mozjpeg):
+            buffer = save_jpeg(img, 85)
+
+        self.assertEqual(img.save.call_args.kwargs["subsampling"], 2)
+        self.assertEqual(buffer.getvalue(), b"\0" * 900)
+        self.assertEqual(buffer.tell(), 900)
+
+    def test_jpeg_compression_gives_up_below_lowest_quality(self):
+        img = MagicMock()
+        img.save.side_effect = lambda buffer, quality, **kwargs: buffer.write(b"\0" * quality * 100)
+
+        self.assertIsNone(compress_jpeg(img, max_size_kb=1))
+        self.assertEqual(img.save.call_count, 2)
+
+
+class TestRunwayImageUpload(unittest.TestCase):
+    """Test sending reference images through the uploads endpoint."""
+
+    def setUp(self):
+        clear_image_cache()
+        self.client = RunwayGen4Client(RunwayConfig(api_key="rk_test_123", upload_images=True))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.image_path = os.path.join(self.tmp.name, "frame.png")
+        with open(self.image_path, "wb") as f:
+            f.write(b"\x89PNG fake image bytes")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    @patch("video_gen.providers.runway_provider.session.requests.Session.post")
+    def test_image_uploaded_and_referenced_by_uri(self, mock_post):
+        upload = MagicMock()
+        upload.json.return_value = {
+            "uploadUrl": "https://uploads.example.com/",
+            "fields": {"key": "abc"},
+            "runwayUri": "runway://abc",
+        }
+        mock_post.return_value = upload
+
+        self.assertEqual(self.client._prepare_image(self.image_path), "runway://abc")
+
+        form = mock_post.call_args_list[1]
+        self.assertEqual(form.args[0], "https://uploads.example.com/")
+        self.assertEqual(form.kwargs["data"], {"key": "abc"})
+        self.assertEqual(form.kwargs["files"]["file"][2], "image/png")
+
+    @patch("video_gen.providers.runway_provider.session.requests.Session.post")
+    def test_failed_upload_falls_back_to_data_uri(self, mock_post):
+        mock_post.return_value.json.return_value = {}
+
+        data_uri = self.client._prepare_image(self.image_path)
+
+        self.assertTrue(data_uri.startswith("data:image/png;base64,"))
+
+
+class TestRunwayTaskCreation(unittest.TestCase):
+    """Test task creation requests."""
+
+    @patch("video_gen.providers.runway_provider.session.requests.Session.post")
+    def test_payload_serialized_once_across_retries(self, mock_post):
+        busy = MagicMock(status_code=503)
+        created = MagicMock(status_code=200)
+        created.json.return_value = {"id": "task_1"}
+        mock_post.side_effect = [busy, created]
+        client = RunwayGen4Client(RunwayConfig(api_key="rk_test_123"))
+
+        with patch.object(client, "_handle_capacity_retry"):
+            task = client.create_image_to_video_task("A lighthouse", None, model="gen4_turbo")
+
+        self.assertEqual(task["id"], "task_1")
+        first, second = (c.kwargs["data"] for c in mock_post.call_args_list)
+        self.assertIs(first, second)
+        self.assertEqual(json.loads(first)["promptText"], "A lighthouse")
+
+    @patch("video_gen.providers.runway_provider.session.requests.Session.post")
+    def test_veo_images_prepared_once_each(self, mock_post):
+        mock_post.return_value = MagicMock(status_code=200)
+        mock_post.return_value.json.return_value = {"id": "task_1"}
+        client = RunwayVeoClient(RunwayConfig(api_key="rk_test_123"))
+
+        with patch.object(client, "_prepare_image", side_effect=lambda path: f"uri:{path}") as mock_prepare:
+            client.create_image_to_video_task(
+                "A lighthouse",
+                first_frame="first.png",
+                last_frame="last.png",
+                reference_images=["first.png", "style.png"],
+            )
+
+        sent = json.loads(mock_post.call_args.kwargs["data"])
+        self.assertEqual(sent["promptImage"], "uri:first.png")
+        self.assertEqual(sent["firstKeyframe"], "uri:first.png")
+        self.assertEqual(sent["lastKeyframe"], "uri:last.png")
+        self.assertEqual(sent["referenceImages"], ["uri:first.png", "uri:style.png"])
+        self.assertCountEqual([c.args[0] for c in mock_prepare.call_args_list], ["first.png", "last.png", "style.png"])
+
+
+class TestRunwayPolling(unittest.TestCase):
+    """Test task status polling."""
+
+    def setUp(self):
+        config = RunwayConfig(api_key="rk_test_123", retry_jitter_percent=0)
+        self.client = RunwayGen4Client(config)
+
+    @patch("video_gen.providers.runway_provider.gen4_client.time.sleep")
+    def test_poll_interval_backs_off(self, mock_sleep):
+        statuses = ["PENDING"] * 5 + ["SUCCEEDED"]
+        with patch.object(self.client, "_get_task", side_effect=[{"status": s} for s in statuses]):
+            result = self.client.poll_task("task_1", initial_delay=5)
+
+        self.assertEqual(result["status"], "SUCCEEDED")
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        self.assertEqual(delays, [5, 2, 4, 8, 15, 15])
+
+    @patch("video_gen.providers.runway_provider.gen4_client.time.sleep")
+    def test_poll_tasks_returns_failures_in_order(self, mock_sleep):
+        responses = {
+            "a": iter([{"id": "a", "status": "RUNNING"}, {"id": "a", "status": "SUCCEEDED"}]),
+            "b": iter([{"id": "b", "status": "FAILED"}]),
+        }
+        with patch.object(self.client, "_get_task", side_effect=lambda task_id: next(responses[task_id])):
+            results = self.client.poll_tasks(["a", "b"])
+
+        self.assertEqual([r["status"] for r in results], ["SUCCEEDED", "FAILED"])
+        self.assertEqual(mock_sleep.call_count, 1)
+
+    @patch("video_gen.providers.runway_provider.aleph_client.time.sleep")
+    def test_aleph_poll_backs_off_and_honours_retry_after(self, mock_sleep):
+        client = RunwayAlephClient(RunwayConfig(api_key="rk_test_123", retry_jitter_percent=0))
+        responses = []
+        for status, headers in [("RUNNING", {}), ("RUNNING", {}), ("RUNNING", {"Retry-After": "9"}), ("SUCCEEDED", {})]:
+            content = json.dumps({"status": status}).encode()
+            responses.append(MagicMock(status_code=200, headers=headers, content=content))
+
+        with patch.object(client, "_get_task_status", side_effect=responses):
+            result = client.poll_task("task_1")
+
+        self.assertEqual(result["status"], "SUCCEEDED")
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [2, 4, 9])
+
+    @patch("video_gen.providers.runway_provider.aleph_client.time.sleep")
+    @patch("video_gen.providers.runway_provider.session.requests.Session.get")
+    def test_aleph_poll_reuses_unmodified_status(self, mock_get, _mock_sleep):
+        client = RunwayAlephClient(RunwayConfig(api_key="rk_test_123"))
+        running = MagicMock(status_code=200, headers={"ETag": '"v1"'}, content=b'{"status": "RUNNING"}')
+        unchanged = MagicMock(status_code=304, headers={}, content=b"")
+        done = MagicMock(status_code=200, headers={}, content=b'{"status": "SUCCEEDED"}')
+        mock_get.side_effect = [running, unchanged, done]
+
+        result = client.poll_task("task_1")
+
+        self.assertEqual(result["status"], "SUCCEEDED")
+        self.assertNotIn("If-None-Match", mock_get.call_args_list[0].kwargs["headers"])
+        self.assertEqual(mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(client._task_etags, {})
+
+    @patch("video_gen.providers.runway_provider.session.requests.Session.get")
+    def test_gen4_poll_reuses_unmodified_status(self, mock_get):
+        running = MagicMock(status_code=200, headers={"ETag": '"v1"'}, content=b'{"status": "RUNNING"}')
+        unchanged = MagicMock(status_code=304, headers={}, content=b"")
+        done = MagicMock(status_code=200, headers={"ETag": '"v2"'}, content=b'{"status": "SUCCEEDED"}')
+        mock_get.side_effect = [running, unchanged, done]
+
+        statuses = [self.client._get_task("task_1")["status"] for _ in range(3)]
+
+        self.assertEqual(statuses, ["RUNNING", "RUNNING", "SUCCEEDED"])
+        self.assertEqual(mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(self.client._task_etags, {})
+
+    @patch("video_gen.providers.runway_provider.veo3_client.time.sleep")
+    @patch("video_gen.providers.runway_provider.session.requests.Session.get")
+    def test_veo_poll_retries_invalid_json(self, mock_get, _mock_sleep):
+        client = RunwayVeoClient(RunwayConfig(api_key="rk_test_123"))
+        garbled = MagicMock(status_code=200, headers={}, content=b"<html>Bad gateway</html>")
+        done = MagicMock(status_code=200, headers={}, content=b'{"status": "SUCCEEDED"}')
+        mock_get.side_effect = [garbled, done]
+
+        result = client.poll_task("task_1")
+
+        self.assertEqual(result["status"], "SUCCEEDED")
+        self.assertEqual(mock_get.call_count, 2)
+
+
+class TestRunwayDownload(unittest.TestCase):
+    """Test streamed video downloads."""
+
+    @patch("video_gen.providers.runway_provider.session.requests.Session.get")
+    def test_streams_body_to_file(self, mock_get):
+        payload = b"\x00video" * 200000
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.raw = io.BytesIO(payload)
+        # Overstate the length; the file must still end where the body does
+        response.headers = {"Content-Length": str(len(payload) + 4096)}
+        mock_get.return_value = response
+        client = RunwayGen4Client(RunwayConfig(api_key="rk_test_123"))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = os.path.join(tmp, "video.mp4")
+            self.assertEqual(client.download_video("https://example.com/v.mp4", output_path), output_path)
+            with open(output_path, "rb") as f:
+                self.assertEqual(f.read(), payload)
+
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+        response.__exit__.assert_called_once()
+
+
+class TestRunwayArtifactTracking(unittest.TestCase):
+    """Test background artifact recording."""
+
+    @patch("video_gen.providers.runway_generator.get_artifact_manager")
+    def test_generated_task_ids_are_unique(self, mock_get_manager):
+        futures = [
+            runway_generator._track_artifact("gen4_turbo", "prompt", f"clip_{i}.mp4", 1280, 720, 5)
+            for i in range(3)
+        ]
+        for future in futures:
+            future.result(timeout=5)
+
+        add_artifact = mock_get_manager.return_value.add_artifact
+        task_ids = [c.kwargs["task_id"] for c in add_artifact.call_args_list]
+        self.assertEqual(len(set(task_ids)), 3)
+        self.assertEqual(
+            [c.kwargs["metadata"]["file_path"] for c in add_artifact.call_args_list],
+            ["clip_0.mp4", "clip_1.mp4", "clip_2.mp4"],
+        )
+
+    def test_manager_resolved_when_write_is_submitted(self):
+        with patch("video_gen.providers.runway_generator.get_artifact_manager") as mock_get_manager:
+            future = runway_generator._track_artifact("gen4_turbo", "prompt", "clip.mp4", 1280, 720, 5)
+        future.result(timeout=5)
+
+        mock_get_manager.return_value.add_artifact.assert_called_once()
+
+
+class TestRunwayBatchGeneration(unittest.TestCase):
+    """Test submitting and collecting several Gen-4 clips at once."""
+
+    @patch("video_gen.providers.runway_generator._track_artifact")
+    @patch("video_gen.providers.runway_generator._get_gen4_client")
+    def test_clips_downloaded_in_prompt_order(self, mock_get_client, _mock_track):
+        client = mock_get_client.return_value
+        client.create_image_to_video_task.side_effect = [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+        client.poll_tasks.return_value = [
+            {"id": t, "status": "SUCCEEDED", "output": [f"https://example.com/{t}.mp4"]} for t in "abc"
+        ]
+        client.download_video.side_effect = lambda url, path: path
+
+        paths = runway_generator.generate_videos_with_runway(
+            ["one", "two", "three"],
+            model="gen4_turbo",
+            out_paths=["1.mp4", "2.mp4", "3.mp4"],
+            config=RunwayConfig(api_key="rk_test_123"),
+        )
+
+        self.assertEqual(paths, ["1.mp4", "2.mp4", "3.mp4"])
+        self.assertEqual(client.download_video.call_count, 3)
+
+    @patch("video_gen.providers.runway_generator._track_artifact")
+    @patch("video_gen.providers.runway_generator._get_gen4_client")
+    def test_tasks_recorded_on_submit_and_each_download_tracked(self, mock_get_client, mock_track):
+        client = mock_get_client.return_value
+        client.create_image_to_video_task.side_effect = [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+        client.poll_tasks.return_value = [
+            {"id": t, "status": "SUCCEEDED", "output": [f"https://example.com/{t}.mp4"]} for t in "abc"
+        ]
+
+        def download(url, path):
+            if path == "2.mp4":
+                raise RuntimeError("Failed to download video")
+            return path
+
+        client.download_video.side_effect = download
+
+        with self.assertRaises(RuntimeError) as ctx:
+            runway_generator.generate_videos_with_runway(
+                ["one", "two", "three"],
+                model="gen4_turbo",
+                out_paths=["1.mp4", "2.mp4", "3.mp4"],
+                config=RunwayConfig(api_key="rk_test_123"),
+            )
+
+        self.assertIn("b: Failed to download video", str(ctx.exception))
+        submitted = [c.kwargs["task_id"] for c in mock_track.call_args_list if c.args[2] is None]
+        downloaded = {c.kwargs["task_id"]: c.args[2] for c in mock_track.call_args_list if c.args[2] is not None}
+        self.assertEqual(submitted, ["a", "b", "c"])
+        self.assertEqual(downloaded, {"a": "1.mp4", "c": "3.mp4"})
+
+
+class TestAlephEncoding(unittest.TestCase):
+    """Test chunked base64 encoding of Aleph inputs."""
+
+    def test_video_encoding_matches_one_shot_encoding(self):
+        client = RunwayAlephClient(RunwayConfig(api_key="rk_test_123"))
+        # Longer than one encode chunk and not a multiple of 3
+        payload = os.urandom(3 * 64 * 1024 + 1000)
+        with tempfile.TemporaryDirectory() as tmp:
+            video_path = os.path.join(tmp, "input.mp4")
+            with open(video_path, "wb") as f:
+                f.write(payload)
+
+            data_uri = client._encode_video(video_path)
+
+        self.assertEqual(data_uri, b"data:video/mp4;base64," + base64.b64encode(payload))
+
+    @patch("video_gen.providers.runway_provider.session.requests.Session.post")
+    def test_edit_task_streams_video_into_json_body(self, mock_post):
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = {"id": "task_1"}
+        client = RunwayAlephClient(RunwayConfig(api_key="rk_test_123"))
+        payload = os.urandom(100000)
+        with tempfile.TemporaryDirectory() as tmp:
+            video_path = os.path.join(tmp, "input.mp4")
+            with open(video_path, "wb") as f:
+                f.write(payload)
+            video_file, mime_type = client._resolve_video(video_path)
+
+            client._create_edit_task("Make it snow", video_file, mime_type, [], 1280, 720, None, None)
+
+            body = mock_post.call_args.kwargs["data"]
+            raw = b"".join(body)
+
+        self.assertEqual(len(raw), len(body))
+        sent = json.loads(raw)
+        self.assertEqual(sent["promptText"], "Make it snow")
+        self.assertEqual(sent["promptImage"], "data:video/mp4;base64," + base64.b64encode(payload).decode("ascii"))
+
+    @patch("video_gen.providers.runway_provider.session.requests.Session.post")
+    def test_edit_with_video_url_skips_upload(self, mock_post):
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = {"id": "task_1"}
+        client = RunwayAlephClient(RunwayConfig(api_key="rk_test_123"))
+        url = "https://example.com/input.mp4"
+
+        with patch.object(client, "poll_task", return_value={"output": {"video_url": "https://example.com/out.mp4"}}), \
+                patch.object(client, "download_video", side_effect=lambda video_url, path: path):
+            client.edit_video("Make it snow", url, out_path="edited.mp4")
+
+        self.assertEqual(json.loads(mock_post.call_args.kwargs["data"])["promptImage"], url)
+
+    @patch("video_gen.providers.runway_provider.aleph_client.time.sleep")
+    @patch("video_gen.providers.runway_provider.session.requests.Session.post")
+    def test_task_creation_retries_transient_errors(self, mock_post, mock_sleep):
+        busy = MagicMock(status_code=503, ok=False, headers={"Retry-After": "3"})
+        created = MagicMock(status_code=200, ok=True)
+        created.json.return_value = {"id": "task_1"}
+        mock_post.side_effect = [busy, created]
+        client = RunwayAlephClient(RunwayConfig(api_key="rk_test_123"))
+
+        task = client._create_generation_task("A lighthouse", [], 1280, 720, 5, None)
+
+        self.assertEqual(task["id"], "task_1")
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertGreaterEqual(mock_sleep.call_args.args[0], 3)
+
+    @patch("video_gen.providers.runway_provider.session.requests.Session.post")
+    def test_reference_image_spliced_into_json_body(self, mock_post):
+        mock_post.return_value.json.return_value = {"id": "task_1"}
+        client = RunwayAlephClient(RunwayConfig(api_key="rk_test_123"))
+        image = os.urandom(5000)
+        with tempfile.TemporaryDirectory() as tmp:
+            image_path = os.path.join(tmp, "style.png")
+            with open(image_path, "wb") as f:
+                f.write(image)
+            reference_data = client._encode_reference_images([image_path])
+
+        client._create_generation_task('A "quoted" prompt', reference_data, 1280, 720, 5, 7)
+
+        sent = json.loads(mock_post.call_args.kwargs["data"])
+        self.assertEqual(sent["promptText"], 'A "quoted" prompt')
+        self.assertEqual(sent["seed"], 7)
+        self.assertEqual(sent["promptImage"], "data:image/png;base64," + base64.b64encode(image).decode("ascii"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,7 +11,7 @@ class TestRunwayInsufficientCredits(unittest.TestCase):
     def setUp(self):
         self.config = RunwayConfig(api_key="rk_test_123")
 
-    @patch("video_gen.providers.runway_provider.veo3_client.requests.post")
+    @patch("video_gen.providers.runway_provider.session.requests.Session.post")
     def test_veo3_insufficient_credits_raises(self, mock_post):
         # Mock a 400 response indicating insufficient credits
         mock_resp = MagicMock()
@@ -34,7 +34,7 @@ class TestRunwayInsufficientCredits(unittest.TestCase):
                     reference_images=["/tmp/fake2.jpg"]
                 )
 
-    @patch("video_gen.providers.runway_provider.gen4_client.requests.post")
+    @patch("video_gen.providers.runway_provider.session.requests.Session.post")
     def test_gen4_insufficient_credits_raises(self, mock_post):
         # Mock a 400 response indicating insufficient credits
         mock_resp = MagicMock()
@@ -55,6 +55,19 @@ class TestRunwayInsufficientCredits(unittest.TestCase):
                     model="gen4"
                 )
 
+    def test_credit_phrases_matched_case_insensitively(self):
+        client = RunwayGen4Client(self.config)
+        cases = [
+            ("", "Insufficient Credits"),
+            ("You do not have enough credits to run this task.", {"code": "bad_request"}),
+            ("NOT ENOUGH CREDIT", None),
+        ]
+        for response_text, error_message in cases:
+            with self.subTest(response_text=response_text, error_message=error_message):
+                self.assertTrue(client._is_insufficient_credits(response_text, error_message))
+
+        self.assertFalse(client._is_insufficient_credits("Invalid ratio", {"error": "Invalid ratio"}))
+
 
 class TestStitchingGracefulStop(unittest.TestCase):
     def test_stitching_stops_on_insufficient_credits(self):
@@ -0,0 +1,299 @@
+"""
+Unit tests for the OpenAI Sora API client.
+
+Covers polling behaviour without touching the network: the OpenAI SDK
+client is replaced with mocks and sleeps are patched out.
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, AsyncMock
+
+import httpx
+import openai
+
+from video_gen.providers.openai_provider import sora_client
+from video_gen.providers.openai_provider.config import SoraConfig
+from video_gen.providers.openai_provider.sora_client import SoraAPIClient
+
+
+def _request() -> httpx.Request:
+    return httpx.Request("GET", "https://api.openai.com/v1/videos/video_123")
+
+
+class TestSoraPollAsyncJob(unittest.TestCase):
+    """Test poll_async_job error classification."""
+
+    def setUp(self):
+        self.config = SoraConfig(api_key="sk-test-key", prewarm_connection=False)
+        self.client = SoraAPIClient(self.config)
+        self.client.client = MagicMock()
+        self.initial = SimpleNamespace(id="video_123", status="queued")
+
+    @patch.object(SoraAPIClient, "_wait")
+    def test_transient_errors_are_retried(self, _mock_sleep):
+        """Connection errors should be retried until the job completes."""
+        completed = SimpleNamespace(id="video_123", status="completed")
+        self.client.client.videos.retrieve.side_effect = [
+            openai.APIConnectionError(request=_request()),
+            completed,
+        ]
+
+        result = self.client.poll_async_job(self.initial)
+
+        self.assertIs(result, completed)
+        self.assertEqual(self.client.client.videos.retrieve.call_count, 2)
+
+    @patch.object(SoraAPIClient, "_wait")
+    def test_permanent_error_raises_immediately(self, _mock_sleep):
+        """A 404 for the job ID should stop polling on the first failure."""
+        self.client.client.videos.retrieve.side_effect = openai.NotFoundError(
+            "Not found",
+            response=httpx.Response(404, request=_request()),
+            body=None,
+        )
+
+        with self.assertRaises(RuntimeError):
+            self.client.poll_async_job(self.initial)
+        self.assertEqual(self.client.client.videos.retrieve.call_count, 1)
+
+    @patch.object(SoraAPIClient, "_wait")
+    def test_gives_up_after_consecutive_transient_errors(self, _mock_sleep):
+        """Polling should abort once the consecutive error budget is spent."""
+        self.config.poll_max_consecutive_errors = 3
+        self.client.client.videos.retrieve.side_effect = openai.APIConnectionError(
+            request=_request()
+        )
+
+        with self.assertRaises(RuntimeError):
+            self.client.poll_async_job(self.initial)
+        self.assertEqual(self.client.client.videos.retrieve.call_count, 3)
+
+    def test_poll_delay_backs_off_to_cap(self):
+        """Poll delays should double from the base interval up to the cap."""
+        self.config.retry_jitter_percent = 0
+        delays = [self.client._get_poll_delay(n) for n in range(6)]
+
+        self.assertEqual(delays, [1, 2, 4, 8, 15, 15])
+
+
+class TestSoraBatchSubmission(unittest.TestCase):
+    """Test concurrent batch submission."""
+
+    def test_batch_returns_results_in_order_with_exceptions(self):
+        """Each request maps to one create call; failures are returned, not raised."""
+        client = SoraAPIClient(SoraConfig(api_key="sk-test-key", prewarm_connection=False))
+        failure = RuntimeError("boom")
+        async_client = MagicMock()
+        async_client.videos.create = AsyncMock(
+            side_effect=[SimpleNamespace(id="video_1"), failure]
+        )
+
+        requests = [
+            {"content_items": ["first"], "width": 1280, "height": 720, "fps": 24, "duration_seconds": 4},
+            {"content_items": ["second"], "width": 1280, "height": 720, "fps": 24, "duration_seconds": 8},
+        ]
+        with patch.object(client, "_get_async_client", return_value=async_client):
+            results = client.create_video_requests_batch(requests)
+
+        self.assertEqual(results[0].id, "video_1")
+        self.assertIs(results[1], failure)
+        prompts = [call.kwargs["prompt"] for call in async_client.videos.create.call_args_list]
+        self.assertEqual(prompts, ["first", "second"])
+
+    def test_batch_limits_requests_in_flight(self):
+        """No more than max_concurrent_requests creates should run at once."""
+        client = SoraAPIClient(
+            SoraConfig(api_key="sk-test-key", prewarm_connection=False, max_concurrent_requests=2)
+        )
+        in_flight = 0
+        peak = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return SimpleNamespace(id=kwargs["prompt"])
+
+        async_client = MagicMock()
+        async_client.videos.create = create
+        requests = [
+            {"content_items": [f"clip {i}"], "width": 1280, "height": 720, "fps": 24, "duration_seconds": 4}
+            for i in range(5)
+        ]
+        with patch.object(client, "_get_async_client", return_value=async_client):
+            results = client.create_video_requests_batch(requests)
+
+        self.assertEqual([r.id for r in results], [f"clip {i}" for i in range(5)])
+        self.assertEqual(peak, 2)
+
+
+class TestSoraPollMany(unittest.TestCase):
+    """Test coalesced polling of several jobs."""
+
+    @patch("video_gen.providers.openai_provider.sora_client.asyncio.sleep", new_callable=AsyncMock)
+    def test_polls_until_all_jobs_finish(self, mock_sleep):
+        """Finished jobs drop out of the poll set; results keep input order."""
+        client = SoraAPIClient(SoraConfig(api_key="sk-test-key", prewarm_connection=False))
+        statuses = {
+            "video_a": iter(["completed"]),
+            "video_b": iter(["in_progress", "failed"]),
+        }
+        async_client = MagicMock()
+        async_client.videos.retrieve = AsyncMock(
+            side_effect=lambda job_id: SimpleNamespace(id=job_id, status=next(statuses[job_id]))
+        )
+
+        initial = [
+            SimpleNamespace(id="video_a", status="queued"),
+            SimpleNamespace(id="video_b", status="queued"),
+        ]
+        with patch.object(client, "_get_async_client", return_value=async_client):
+            results = client.poll_many(initial)
+
+        self.assertEqual([r.status for r in results], ["completed", "failed"])
+        self.assertEqual(mock_sleep.await_count, 2)
+        self.assertEqual(async_client.videos.retrieve.await_count, 3)
+
+
+class TestSoraClientSharing(unittest.TestCase):
+    """Test that instances share the underlying OpenAI client."""
+
+    def test_same_api_key_shares_openai_client(self):
+        first = SoraAPIClient(SoraConfig(api_key="sk-shared-key", prewarm_connection=False))
+        second = SoraAPIClient(SoraConfig(api_key="sk-shared-key", prewarm_connection=False))
+        other = SoraAPIClient(SoraConfig(api_key="sk-other-key", prewarm_connection=False))
+
+        self.assertIs(first.client, second.client)
+        self.assertIsNot(first.client, other.client)
+
+    def test_prewarm_sends_bare_head_request(self):
+        sora_client._models_cache.clear()
+        requests_seen = []
+        transport = httpx.MockTransport(
+            lambda request: requests_seen.append(request) or httpx.Response(404, request=request)
+        )
+
+        sora_client._prewarm_connection(httpx.Client(transport=transport), "https://api.openai.com/v1/")
+
+        self.assertEqual([(r.method, str(r.url)) for r in requests_seen], [("HEAD", "https://api.openai.com/v1/")])
+        self.assertNotIn("authorization", requests_seen[0].headers)
+        self.assertEqual(sora_client._models_cache, {})
+
+    def test_malformed_key_rejected(self):
+        for key in ("'sk-quoted-key'", "sk-key with-space", "AIzaSyExampleGoogleKey"):
+            with self.subTest(key=key), self.assertRaises(ValueError):
+                SoraAPIClient(SoraConfig(api_key=key, prewarm_connection=False))
+
+
+class TestSoraRetryAfterHint(unittest.TestCase):
+    """Test extraction of server-provided retry delays."""
+
+    def setUp(self):
+        self.client = SoraAPIClient(SoraConfig(api_key="sk-test-key", prewarm_connection=False))
+
+    def test_header_takes_precedence(self):
+        response = httpx.Response(503, headers={"retry-after": "7"}, request=_request())
+        error = openai.InternalServerError("Please retry after 3 seconds", response=response, body=None)
+
+        self.assertEqual(self.client._get_retry_after_hint(error), 7.0)
+
+    def test_message_hint_used_without_header(self):
+        error = RuntimeError("503 at capacity. Please retry after 3 seconds.")
+
+        self.assertEqual(self.client._get_retry_after_hint(error), 3.0)
+
+    def test_no_hint(self):
+        self.assertIsNone(self.client._get_retry_after_hint(RuntimeError("503 capacity")))
+
+
+class TestSoraCapacityRetryLimit(unittest.TestCase):
+    """Test that capacity retries stop after max_retries."""
+
+    def test_gives_up_after_max_retries(self):
+        config = SoraConfig(api_key="sk-test-key", prewarm_connection=False, max_retries=2)
+        client = SoraAPIClient(config)
+        client.client = MagicMock()
+        client._cancel_event = MagicMock()
+        client._cancel_event.wait.return_value = False
+        client.client.videos.create.side_effect = RuntimeError("503 Service Unavailable: at capacity")
+
+        with self.assertRaises(RuntimeError) as ctx:
+            client._execute_video_request_with_retry("sora-2", "prompt", 1280, 720, 4)
+
+        self.assertIn("Max retries exceeded", str(ctx.exception))
+        self.assertEqual(client.client.videos.create.call_count, 3)
+        self.assertEqual(client._cancel_event.wait.call_count, 2)
+
+    def test_cancel_interrupts_backoff(self):
+        client = SoraAPIClient(SoraConfig(api_key="sk-test-key", prewarm_connection=False))
+        client.client = MagicMock()
+        client.client.videos.create.side_effect = RuntimeError("503 Service Unavailable: at capacity")
+        client.cancel()
+
+        with self.assertRaises(RuntimeError) as ctx:
+            client._execute_video_request_with_retry("sora-2", "prompt", 1280, 720, 4)
+
+        self.assertIn("cancelled", str(ctx.exception))
+        self.assertEqual(client.client.videos.create.call_count, 1)
+
+
+class TestSoraModelsCache(unittest.TestCase):
+    """Test caching of the model list used in model-not-found errors."""
+
+    def setUp(self):
+        sora_client._models_cache.clear()
+        self.client = SoraAPIClient(SoraConfig(api_key="sk-test-key", prewarm_connection=False))
+        self.client.client = MagicMock()
+        self.client.client.models.list.return_value = SimpleNamespace(
+            data=[SimpleNamespace(id="sora-2"), SimpleNamespace(id="gpt-4o")]
+        )
+
+    def tearDown(self):
+        sora_client._models_cache.clear()
+
+    def test_model_list_fetched_once(self):
+        for _ in range(2):
+            with self.assertRaises(RuntimeError) as ctx:
+                self.client._handle_model_not_found_error("sora-9", "404 not found")
+            self.assertIn("sora-2", str(ctx.exception))
+
+        self.assertEqual(self.client.client.models.list.call_count, 1)
+
+    def test_expired_entry_is_refreshed(self):
+        sora_client._models_cache["sk-test-key"] = (
+            time.monotonic() - sora_client._MODELS_CACHE_TTL_SECONDS - 1, ["sora-old"]
+        )
+
+        models = sora_client._get_sora_models(self.client.client, "sk-test-key")
+
+        self.assertEqual(models, ["sora-2"])
+        self.assertEqual(self.client.client.models.list.call_count, 1)
+
+
+class TestSoraDownload(unittest.TestCase):
+    """Test streamed video downloads."""
+
+    def test_streams_content_to_file(self):
+        payload = b"\x00video" * 1000
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=payload, request=request)
+        )
+        client = SoraAPIClient(SoraConfig(api_key="sk-test-key", prewarm_connection=False))
+        client.client = openai.OpenAI(api_key="sk-test-key", http_client=httpx.Client(transport=transport))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = os.path.join(tmp, "video.mp4")
+            client.download_video("video_123", output_path)
+            with open(output_path, "rb") as f:
+                self.assertEqual(f.read(), payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
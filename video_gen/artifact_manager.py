@@ -10,6 +10,8 @@ Provides functionality to:
 
 import json
 import os
+import shutil
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
@@ -18,6 +20,17 @@ import requests
 
 from .logger import get_library_logger
 
+# Copy buffer for video downloads; generated clips are tens of megabytes
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _stream_to_file(response: requests.Response, output_path: str) -> None:
+    """Copy a streamed response body to disk in large blocks."""
+    # Undo any Content-Encoding the server applied
+    response.raw.decode_content = True
+    with open(output_path, 'wb') as f:
+        shutil.copyfileobj(response.raw, f, _DOWNLOAD_CHUNK_SIZE)
+
 
 @dataclass
 class VideoArtifact:
@@ -55,6 +68,8 @@ class ArtifactManager:
         self.downloads_dir.mkdir(exist_ok=True)
         
         self.logger = get_library_logger()
+        # Serializes metadata writes when generations run on several threads
+        self._save_lock = threading.Lock()
         self._load_artifacts()
     
     def _load_artifacts(self) -> None:
@@ -75,11 +90,12 @@ class ArtifactManager:
     def _save_artifacts(self) -> None:
         """Save artifacts to metadata file."""
         try:
-            data = {
-                k: asdict(v) for k, v in self.artifacts.items()
-            }
-            with open(self.metadata_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with self._save_lock:
+                data = {
+                    k: asdict(v) for k, v in list(self.artifacts.items())
+                }
+                with open(self.metadata_file, 'w') as f:
+                    json.dump(data, f, indent=2)
         except Exception as e:
             self.logger.error(f"Failed to save artifacts: {e}")
     
@@ -285,11 +301,9 @@ class ArtifactManager:
                 stream=True,
                 timeout=300
             )
-            response.raise_for_status()
-            
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            with response:
+                response.raise_for_status()
+                _stream_to_file(response, output_path)
             
             return True
             
@@ -309,11 +323,9 @@ class ArtifactManager:
                 stream=True,
                 timeout=300
             )
-            response.raise_for_status()
-            
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            with response:
+                response.raise_for_status()
+                _stream_to_file(response, output_path)
             
             return True
             
@@ -358,12 +370,16 @@ class ArtifactManager:
 
 # Global artifact manager instance
 _artifact_manager = None
+_artifact_manager_lock = threading.Lock()
 
 def get_artifact_manager() -> ArtifactManager:
     """Get global artifact manager instance."""
     global _artifact_manager
     if _artifact_manager is None:
-        _artifact_manager = ArtifactManager()
+        # Generators record artifacts from worker threads; create only one
+        with _artifact_manager_lock:
+            if _artifact_manager is None:
+                _artifact_manager = ArtifactManager()
     return _artifact_manager
 
 
@@ -1,11 +1,9 @@
-"""Common exception types for the video_gen package."""
+"""Common exception types for the video_gen package.
 
-class InsufficientCreditsError(RuntimeError):
-    """Raised when a provider indicates the account does not have enough credits.
+Kept for backwards compatibility; the exception classes live in
+``video_gen.exceptions``.
+"""
 
-    This should be treated as a non-retryable, user-actionable error.
-    """
+from .exceptions import InsufficientCreditsError
 
-    def __init__(self, message: str = "Insufficient credits", provider: str | None = None):
-        self.provider = provider
-        super().__init__(message)
+__all__ = ["InsufficientCreditsError"]
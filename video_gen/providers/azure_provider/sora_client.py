@@ -14,6 +14,9 @@ from openai import AzureOpenAI
 from .config import AzureSoraConfig
 from ...retry_utils import handle_capacity_retry
 
+# Example values from the docs that are not real API keys
+_PLACEHOLDER_KEYS = frozenset({"your_azure_api_key_here", "your_api_key_here"})
+
 
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the given name."""
@@ -54,7 +57,7 @@ class AzureSoraAPIClient:
         
         # Validate API key if provided
         if config.api_key:
-            if config.api_key in ("your_azure_api_key_here", "your_api_key_here"):
+            if config.api_key in _PLACEHOLDER_KEYS:
                 raise ValueError(
                     f"AZURE_OPENAI_API_KEY appears to be a placeholder: '{config.api_key}'\n"
                     "Replace it with your actual API key from Azure portal,\n"
@@ -66,7 +69,9 @@ class AzureSoraAPIClient:
             azure_endpoint=config.azure_endpoint,
             api_version=config.api_version
         )
-        self.logger.debug(f"AzureSoraAPIClient initialized: endpoint={config.azure_endpoint}")
+        # Status endpoint that last answered; see _retrieve_job
+        self._preferred_retrieve = "responses"
+        self.logger.debug("AzureSoraAPIClient initialized: endpoint=%s", config.azure_endpoint)
     
     def create_video_request(
         self,
@@ -99,7 +104,7 @@ class AzureSoraAPIClient:
         """
         selected_model = model or self.config.default_model
         self.logger.info(f"Creating Azure Sora video request: model={selected_model}, {width}x{height}, {fps}fps, {duration_seconds}s")
-        self.logger.debug(f"Content items: {len(content_items)} items, seed: {seed}")
+        self.logger.debug("Content items: %d items, seed: %s", len(content_items), seed)
         
         return self._execute_azure_video_request_with_retry(
             selected_model, content_items, width, height, fps, duration_seconds, seed
@@ -135,13 +140,13 @@ class AzureSoraAPIClient:
         """
         retry_count = 0
         
+        # Request parameters are built once and reused unchanged on every retry
+        messages = [{"role": "user", "content": str(content_items)}]  # type: ignore
+        extra_body = self._prepare_azure_extra_body(width, height, duration_seconds, fps, seed)
+        
         while True:  # Retry forever until success
             try:
-                self.logger.debug(f"Sending Azure API request (attempt {retry_count + 1})")
-                
-                # Prepare Azure-specific request parameters  
-                messages = [{"role": "user", "content": str(content_items)}]  # type: ignore
-                extra_body = self._prepare_azure_extra_body(width, height, duration_seconds, fps, seed)
+                self.logger.debug("Sending Azure API request (attempt %d)", retry_count + 1)
                 
                 response = self.client.chat.completions.create(
                     model=model,
@@ -276,6 +281,39 @@ class AzureSoraAPIClient:
         """
         handle_capacity_retry(retry_count, self.config, self.logger)
     
+    def _retrieve_job(self, job_id: str) -> Optional[Any]:
+        """
+        Retrieve job status, trying the last endpoint that worked first.
+        
+        Azure deployments expose job status through either responses.retrieve
+        or chat.completions.retrieve. Once one succeeds it is remembered, so
+        later polls make a single request instead of failing over every time.
+        
+        Args:
+            job_id: Azure job ID
+            
+        Returns:
+            Job response, or None if both endpoints failed
+        """
+        endpoints = {
+            "responses": self.client.responses.retrieve,
+            "chat.completions": self.client.chat.completions.retrieve,
+        }
+        order = [self._preferred_retrieve] + [name for name in endpoints if name != self._preferred_retrieve]
+        
+        for name in order:
+            try:
+                self.logger.debug("Retrieving Azure job status via %s.retrieve", name)
+                response = endpoints[name](job_id)
+            except Exception as e:
+                self.logger.debug("%s.retrieve failed: %s", name, e)
+                continue
+            self._preferred_retrieve = name
+            return response
+        
+        self.logger.debug("All status endpoints failed, will retry")
+        return None
+    
     def poll_async_job(self, response: Any) -> Any:
         """
         Poll an asynchronous job until completion.
@@ -301,17 +339,9 @@ class AzureSoraAPIClient:
                 last_state = status
             time.sleep(3)  # Poll every 3 seconds
             
-            # Try to retrieve job status using available API endpoints
-            try:
-                self.logger.debug("Retrieving Azure job status via responses.retrieve")
-                response = self.client.responses.retrieve(job_id)
-            except Exception as e1:
-                self.logger.debug(f"responses.retrieve failed: {e1}, trying chat.completions.retrieve")
-                try:
-                    response = self.client.chat.completions.retrieve(job_id)
-                except Exception as e2:
-                    self.logger.debug(f"chat.completions.retrieve also failed: {e2}, will retry")
-                    continue
+            response = self._retrieve_job(job_id)
+            if response is None:
+                continue
             status = getattr(response, "status", None) or "queued"
         
         if status != "completed":
@@ -341,9 +371,9 @@ class AzureSoraAPIClient:
         
         # Convert to bytes if needed for type safety
         if hasattr(blob, '__len__'):
-            self.logger.debug(f"Writing video to: {output_path} ({len(blob)} bytes)")  # type: ignore
+            self.logger.debug("Writing video to: %s (%d bytes)", output_path, len(blob))  # type: ignore
         else:
-            self.logger.debug(f"Writing video to: {output_path}")
+            self.logger.debug("Writing video to: %s", output_path)
         
         # Save video to specified output path
         with open(output_path, "wb") as f:
@@ -33,10 +33,20 @@ class SoraConfig:
     default_output: str = "openai_output.mp4"
     
     # Retry configuration
+    max_retries: int = 3            # Capacity retries after the first attempt
     retry_base_delay: int = 30      # Initial retry delay in seconds
     retry_max_delay: int = 300      # Maximum retry delay in seconds
     retry_jitter_percent: float = 0.2  # Jitter percentage (±20%)
     
+    # Connection configuration
+    prewarm_connection: bool = True  # Warm the API connection with a background HEAD on client creation; no API call
+    max_concurrent_requests: int = 5  # Batch submissions in flight at once
+    
+    # Polling configuration
+    poll_base_interval: float = 1.0   # First status-check delay in seconds, doubled each poll
+    poll_max_interval: float = 15.0   # Maximum delay between status checks
+    poll_max_consecutive_errors: int = 10  # Abort polling after this many transient errors in a row
+    
     # Supported file types
     supported_image_mime_prefixes: tuple = (IMAGE_MIME_PREFIX,)
     
@@ -4,17 +4,220 @@ OpenAI Sora API client with retry logic for video generation.
 Handles API calls, error handling, and exponential backoff retry mechanisms.
 """
 
+import asyncio
+import re
+import sys
+import threading
 import time
+import weakref
 import logging
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 
+import httpx
 import openai
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI, DefaultHttpxClient, DefaultAsyncHttpxClient
 
 from ...logger import get_library_logger
-from ...retry_utils import handle_capacity_retry
+from ...retry_utils import calculate_retry_delay, handle_capacity_retry
 from .config import SoraConfig
 
+# Example values from the docs that are not real API keys
+_PLACEHOLDER_KEYS = frozenset({"your_openai_api_key_here", "your_api_key_here", "sk-..."})
+
+# Shape of an OpenAI secret key ("sk-..." / "sk-proj-..."); catches stray
+# quotes, whitespace or a key from another provider before any client is built
+_API_KEY_RE = re.compile(r"sk-[A-Za-z0-9_\-]+")
+
+# Content item types that carry prompt text
+_TEXT_TYPES = frozenset({"text", "input_text"})
+
+# Help banners printed for common, user-fixable API errors
+_BANNER_RULE = "=" * 60
+
+_CONNECTION_ERROR_BANNER = (
+    f"\n{_BANNER_RULE}\n"
+    "🔒 Connection/SSL Error\n"
+    f"{_BANNER_RULE}\n"
+    "Failed to connect to OpenAI API due to network/SSL issues.\n"
+    "\n💡 Quick fixes:\n"
+    "   • Check your internet connection\n"
+    "   • Try running: pip install --upgrade certifi\n"
+    "   • If using corporate network, check proxy settings\n"
+    "   • Temporarily try a different network (mobile hotspot)\n"
+    "\n🔄 Alternative options:\n"
+    "   • Try Google Veo: --provider google\n"
+    "   • Try RunwayML: --provider runway\n"
+    f"{_BANNER_RULE}\n"
+)
+
+_ORGANIZATION_VERIFICATION_BANNER = (
+    f"\n{_BANNER_RULE}\n"
+    "⚠️  OpenAI Organization Verification Required\n"
+    f"{_BANNER_RULE}\n"
+    "Your OpenAI organization needs to be verified to use Sora models.\n"
+    "\n"
+    "✅ If you haven't verified yet:\n"
+    "   Visit: https://platform.openai.com/settings/organization/general\n"
+    "   Click 'Verify Organization'\n"
+    "\n"
+    "⏳ If you've already verified:\n"
+    "   Please wait up to 15 minutes for access to propagate\n"
+    "   Then try again with the same command\n"
+    "\n"
+    "🔄 Alternative options while waiting:\n"
+    "   • Try Google Veo: --provider google\n"
+    "   • Try RunwayML: --provider runway\n"
+    f"{_BANNER_RULE}\n"
+)
+
+# Formatted with duration_seconds
+_INVALID_DURATION_BANNER = (
+    f"\n{_BANNER_RULE}\n"
+    "⚠️  Invalid Duration Parameter\n"
+    f"{_BANNER_RULE}\n"
+    "You requested {duration_seconds} seconds, but OpenAI Sora only supports:\n"
+    "   • 4 seconds  (--duration 4)\n"
+    "   • 8 seconds  (--duration 8)\n"
+    "   • 12 seconds (--duration 12)\n"
+    "\n"
+    "🔄 Please try again with a supported duration:\n"
+    "   ./image2video.py --provider openai --duration 8 [other options]\n"
+    f"{_BANNER_RULE}\n"
+)
+
+# Error-message classifiers, checked in _handle_non_retryable_error order
+_CAPACITY_ERROR_RE = re.compile(r"503.*capacity|capacity.*503", re.IGNORECASE | re.DOTALL)
+_CONNECTION_ERROR_RE = re.compile(r"ssl|certificate|connection", re.IGNORECASE)
+_ORGANIZATION_VERIFICATION_RE = re.compile(
+    r"403.*organization must be verified|organization must be verified.*403", re.IGNORECASE | re.DOTALL
+)
+_NOT_FOUND_ERROR_RE = re.compile(r"404|not found", re.IGNORECASE)
+_UNAUTHORIZED_ERROR_RE = re.compile(r"401|unauthorized", re.IGNORECASE)
+
+# Retry hint embedded in error messages, e.g. "Please retry after 3 seconds"
+_RETRY_AFTER_RE = re.compile(r"retry after (\d+(?:\.\d+)?)", re.IGNORECASE)
+
+# Job states after which polling stops
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+# Read size for streamed video downloads
+_DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Connection pool sizing for the shared sync and async HTTP clients
+_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+# OpenAI clients shared by every SoraAPIClient in the process, keyed by API key,
+# so repeated constructions reuse one warm HTTP connection pool
+_client_cache: Dict[str, OpenAI] = {}
+
+# Sora model IDs visible to each API key, with the monotonic time they were fetched
+_models_cache: Dict[str, Tuple[float, List[str]]] = {}
+_MODELS_CACHE_TTL_SECONDS = 3600
+
+# Async connections are bound to the event loop that opened them, so async
+# clients are shared per loop (and dropped with it) rather than process-wide
+_async_client_cache: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_openai_client(api_key: str, prewarm: bool = False) -> OpenAI:
+    """
+    Get the shared OpenAI client for an API key, creating it on first use.
+    
+    Args:
+        api_key: OpenAI API key
+        prewarm: Open a connection in the background when the client is created
+        
+    Returns:
+        OpenAI client shared across SoraAPIClient instances
+    """
+    client = _client_cache.get(api_key)
+    if client is None:
+        http_client = DefaultHttpxClient(limits=_HTTP_LIMITS)
+        client = OpenAI(api_key=api_key, http_client=http_client)
+        _client_cache[api_key] = client
+        if prewarm:
+            threading.Thread(
+                target=_prewarm_connection,
+                args=(http_client, str(client.base_url)),
+                name="sora-prewarm",
+                daemon=True
+            ).start()
+    return client
+
+
+def _get_async_openai_client(api_key: str) -> AsyncOpenAI:
+    """
+    Get the async OpenAI client for an API key on the running event loop.
+    
+    All SoraAPIClient instances running on the same loop share one pooled
+    connection set; a new client is created for each new loop (e.g.
+    successive ``asyncio.run`` calls from the sync wrappers).
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        AsyncOpenAI client usable on the current event loop
+    """
+    loop = asyncio.get_running_loop()
+    loop_clients = _async_client_cache.setdefault(loop, {})
+    client = loop_clients.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(limits=_HTTP_LIMITS)
+        )
+        loop_clients[api_key] = client
+    return client
+
+
+def _prewarm_connection(http_client: httpx.Client, base_url: str) -> None:
+    """
+    Establish a keep-alive connection to the OpenAI API.
+    
+    Runs on a daemon thread so the TCP/TLS handshake overlaps with the rest
+    of the caller's setup (uploads, prompt building) instead of delaying the
+    first video request. Only an unauthenticated HEAD is sent: whatever it
+    returns, the connection stays in the client's pool, and no API call is
+    made. Failures are ignored; the real request will report any
+    connectivity problem.
+    
+    Args:
+        http_client: HTTP client backing the OpenAI client to warm
+        base_url: OpenAI API base URL
+    """
+    try:
+        http_client.head(base_url, timeout=10)
+    except Exception as e:
+        get_library_logger().debug("Connection pre-warm failed: %s", e)
+
+
+def _get_sora_models(client: OpenAI, api_key: str) -> List[str]:
+    """
+    Get the Sora model IDs available to an API key.
+    
+    Results are cached for _MODELS_CACHE_TTL_SECONDS so repeated model
+    errors don't each cost an extra API round-trip.
+    
+    Args:
+        client: OpenAI client to query on a cache miss
+        api_key: API key the cache entry belongs to
+        
+    Returns:
+        List of Sora model IDs
+        
+    Raises:
+        Exception: Any error from the models API on a cache miss
+    """
+    cached = _models_cache.get(api_key)
+    if cached is not None and time.monotonic() - cached[0] < _MODELS_CACHE_TTL_SECONDS:
+        return cached[1]
+    model_ids = [m.id for m in client.models.list().data if m.id.startswith("sora")]
+    _models_cache[api_key] = (time.monotonic(), model_ids)
+    return model_ids
+
 
 class SoraAPIClient:
     """OpenAI API client with Sora-specific functionality and retry logic."""
@@ -26,9 +229,6 @@ class SoraAPIClient:
         Args:
             config: Sora configuration containing API key and retry settings
         """
-        if OpenAI is None:
-            raise ImportError("Please `pip install openai` first.")
-        
         self.config = config
         self.logger = get_library_logger()
         
@@ -41,16 +241,53 @@ class SoraAPIClient:
             )
         
         # Check for placeholder values
-        if config.api_key in ("your_openai_api_key_here", "your_api_key_here", "sk-..."):
+        if config.api_key in _PLACEHOLDER_KEYS:
             raise ValueError(
                 f"OPENAI_API_KEY appears to be a placeholder: '{config.api_key}'\n"
                 "Replace it with your actual API key from:\n"
                 "https://platform.openai.com/api-keys"
             )
         
-        self.client = OpenAI(api_key=config.api_key)
+        if not _API_KEY_RE.fullmatch(config.api_key):
+            raise ValueError(
+                "OPENAI_API_KEY is not a valid OpenAI API key.\n"
+                "Keys start with 'sk-' and contain no spaces or quotes.\n"
+                "Copy your key again from: https://platform.openai.com/api-keys"
+            )
+        
+        self.client = _get_openai_client(config.api_key, prewarm=config.prewarm_connection)
+        # Set by cancel() to interrupt retry backoff and polling waits
+        self._cancel_event = threading.Event()
         self.logger.debug("SoraAPIClient initialized")
     
+    def cancel(self) -> None:
+        """
+        Cancel in-progress retries and polling on this client.
+        
+        Safe to call from another thread or a signal handler; the blocked
+        call raises RuntimeError as soon as its current wait is interrupted.
+        """
+        self._cancel_event.set()
+    
+    def _wait(self, seconds: float) -> None:
+        """
+        Sleep for up to ``seconds``, returning early if the client is cancelled.
+        
+        Raises:
+            RuntimeError: If cancel() was called
+        """
+        if self._cancel_event.wait(seconds):
+            raise RuntimeError("Operation cancelled")
+    
+    def _get_async_client(self) -> AsyncOpenAI:
+        """
+        Get the shared async OpenAI client for the running event loop.
+        
+        Returns:
+            AsyncOpenAI client usable on the current event loop
+        """
+        return _get_async_openai_client(self.config.api_key)
+    
     def create_video_request(
         self,
         content_items: List[Dict[str, Any]],
@@ -81,12 +318,90 @@ class SoraAPIClient:
             KeyboardInterrupt: If user cancels during retry
         """
         selected_model = model or self.config.default_model
-        self.logger.info(f"Creating Sora-2 video request: model={selected_model}, {width}x{height}, {fps}fps, {duration_seconds}s")
-        self.logger.debug(f"Content items: {len(content_items)} items, seed: {seed}")
+        self.logger.info(
+            "Creating Sora-2 video request: model=%s, %sx%s, %sfps, %ss",
+            selected_model, width, height, fps, duration_seconds
+        )
+        self.logger.debug("Content items: %d items, seed: %s", len(content_items), seed)
         
         prompt_text = self._extract_prompt_from_content(content_items)
         return self._execute_video_request_with_retry(selected_model, prompt_text, width, height, duration_seconds, seed)
     
+    def create_video_requests_batch(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Submit several video generation requests concurrently.
+        
+        Synchronous wrapper around create_video_requests_batch_async.
+        
+        Args:
+            requests: List of keyword-argument dicts, each accepted by
+                create_video_request (content_items, width, height, fps,
+                duration_seconds and optionally seed and model)
+            
+        Returns:
+            List of API responses or exceptions, in the order of ``requests``
+        """
+        return asyncio.run(self.create_video_requests_batch_async(requests))
+    
+    async def create_video_requests_batch_async(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Submit several video generation requests concurrently.
+        
+        ``videos.create`` calls are issued concurrently on a single event loop
+        instead of paying one full round-trip per video, with at most
+        config.max_concurrent_requests in flight to stay within rate limits.
+        Capacity retries are not applied here; failed items are returned as
+        exceptions so the caller can resubmit them individually with
+        create_video_request.
+        
+        Args:
+            requests: List of keyword-argument dicts, each accepted by
+                create_video_request (content_items, width, height, fps,
+                duration_seconds and optionally seed and model)
+            
+        Returns:
+            List of API responses or exceptions, in the order of ``requests``
+        """
+        self.logger.info("Submitting %d Sora-2 video requests concurrently", len(requests))
+        async_client = self._get_async_client()
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
+        
+        async def submit(request: Dict[str, Any]) -> Any:
+            params = self._build_request_parameters(**request)
+            async with semaphore:
+                return await async_client.videos.create(**params)
+        
+        return await asyncio.gather(*[submit(request) for request in requests], return_exceptions=True)
+    
+    def _build_request_parameters(
+        self,
+        content_items: List[Dict[str, Any]],
+        width: int,
+        height: int,
+        fps: int,
+        duration_seconds: int,
+        seed: Optional[int] = None,
+        model: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build API parameters from create_video_request-style arguments.
+        
+        Args:
+            content_items: List of content items (text + images)
+            width: Video width in pixels
+            height: Video height in pixels
+            fps: Frames per second (not sent to the API)
+            duration_seconds: Video duration in seconds
+            seed: Optional random seed
+            model: Model to use, defaults to config default
+            
+        Returns:
+            Dictionary of API parameters
+        """
+        selected_model = model or self.config.default_model
+        prompt_text = self._extract_prompt_from_content(content_items)
+        return self._prepare_video_parameters(selected_model, prompt_text, width, height, duration_seconds, seed)
+    
     def _extract_prompt_from_content(self, content_items: List[Union[Dict[str, Any], str]]) -> str:
         """
         Extract text prompt from content items.
@@ -101,7 +416,7 @@ class SoraAPIClient:
         
         for item in content_items:
             if isinstance(item, dict):
-                if item.get("type") in ["text", "input_text"]:
+                if item.get("type") in _TEXT_TYPES:
                     prompt_text += item.get("text", "")
                 elif item.get("type") == "image_url":
                     # For now, we'll handle images separately
@@ -123,7 +438,9 @@ class SoraAPIClient:
         seed: Optional[int] = None
     ) -> Any:
         """
-        Execute video request with infinite retry on capacity issues.
+        Execute video request, retrying capacity issues up to config.max_retries times.
+        
+        Total backoff time is capped at retry_max_delay * max_retries.
         
         Args:
             model: Model to use for generation
@@ -137,28 +454,49 @@ class SoraAPIClient:
             API response object
             
         Raises:
-            RuntimeError: For non-retryable errors
+            RuntimeError: For non-retryable errors or when retries are exhausted
         """
+        max_retries = self.config.max_retries
+        max_total_delay = self.config.retry_max_delay * max_retries
         retry_count = 0
+        total_delay = 0.0
+        
+        # Built once and reused unchanged on every retry
+        video_params = self._prepare_video_parameters(model, prompt, width, height, duration_seconds, seed)
         
-        while True:  # Retry forever until success
+        while True:
             try:
-                self.logger.debug(f"Sending API request (attempt {retry_count + 1})")
+                self.logger.debug("Sending API request (attempt %d/%d)", retry_count + 1, max_retries + 1)
                 
-                video_params = self._prepare_video_parameters(model, prompt, width, height, duration_seconds, seed)
                 response = self.client.videos.create(**video_params)
                 
                 self.logger.info("Sora-2 API request successful")
                 return response
                 
             except Exception as e:
-                if self._should_retry_error(e):
-                    retry_count += 1
-                    self.logger.warning(f"Capacity issue detected, retrying... (attempt {retry_count})")
-                    self._handle_capacity_retry(retry_count)
-                    continue
-                else:
+                if not self._should_retry_error(e):
                     self._handle_non_retryable_error(e, model, duration_seconds)
+                
+                if retry_count >= max_retries or total_delay >= max_total_delay:
+                    self.logger.error(
+                        f"Sora-2 still at capacity after {retry_count + 1} attempts "
+                        f"({total_delay:.1f}s waited)"
+                    )
+                    raise RuntimeError(
+                        f"Max retries exceeded: Sora-2 still at capacity after {retry_count + 1} attempts. "
+                        "Try again later or use another provider."
+                    ) from e
+                
+                retry_count += 1
+                self.logger.warning(
+                    f"Capacity issue detected, retrying... (attempt {retry_count}/{max_retries}, "
+                    f"{total_delay:.1f}s waited so far)"
+                )
+                total_delay += self._handle_capacity_retry(
+                    retry_count,
+                    self._get_retry_after_hint(e),
+                    max_total_delay - total_delay
+                )
     
     def _prepare_video_parameters(
         self, 
@@ -193,7 +531,7 @@ class SoraAPIClient:
         if seed is not None:
             video_params["seed"] = str(seed)
         
-        self.logger.debug(f"Video creation parameters: {video_params}")
+        self.logger.debug("Video creation parameters: %s", video_params)
         return video_params
     
     def _should_retry_error(self, error: Exception) -> bool:
@@ -206,8 +544,7 @@ class SoraAPIClient:
         Returns:
             True if error should trigger retry, False otherwise
         """
-        error_str = str(error)
-        return "503" in error_str and "capacity" in error_str.lower()
+        return _CAPACITY_ERROR_RE.search(str(error)) is not None
     
     def _handle_non_retryable_error(self, error: Exception, model: str, duration_seconds: int) -> None:
         """
@@ -222,7 +559,7 @@ class SoraAPIClient:
             Various exceptions based on error type
         """
         error_str = str(error)
-        self.logger.debug(f"API error occurred: {error_str}")
+        self.logger.debug("API error occurred: %s", error_str)
         
         if self._is_connection_error(error_str, error):
             self._handle_connection_error()
@@ -230,9 +567,9 @@ class SoraAPIClient:
             self._handle_organization_verification_error()
         elif self._is_invalid_duration_error(error_str):
             self._handle_invalid_duration_error(duration_seconds)
-        elif "404" in error_str or "not found" in error_str.lower():
+        elif _NOT_FOUND_ERROR_RE.search(error_str):
             self._handle_model_not_found_error(model, error_str)
-        elif "401" in error_str or "unauthorized" in error_str.lower():
+        elif _UNAUTHORIZED_ERROR_RE.search(error_str):
             self._handle_authentication_error()
         else:
             self.logger.error(f"Unexpected API error: {error}")
@@ -240,32 +577,26 @@ class SoraAPIClient:
     
     def _is_connection_error(self, error_str: str, error: Exception) -> bool:
         """Check if error is a connection/SSL error."""
-        return ("ssl" in error_str.lower() or "certificate" in error_str.lower() or 
-                "connection" in error_str.lower() or "apiconnectionerror" in str(type(error)).lower())
+        return (isinstance(error, openai.APIConnectionError)
+                or _CONNECTION_ERROR_RE.search(error_str) is not None)
     
     def _is_organization_verification_error(self, error_str: str) -> bool:
         """Check if error is an organization verification error."""
-        return "403" in error_str and "organization must be verified" in error_str.lower()
+        return _ORGANIZATION_VERIFICATION_RE.search(error_str) is not None
     
     def _is_invalid_duration_error(self, error_str: str) -> bool:
         """Check if error is an invalid duration error."""
         return "400" in error_str and "Invalid value" in error_str and "seconds" in error_str
     
+    @staticmethod
+    def _print_banner(banner: str) -> None:
+        """Write a multi-line help banner to stdout in a single call."""
+        sys.stdout.write(banner)
+        sys.stdout.flush()
+    
     def _handle_connection_error(self) -> None:
         """Handle connection/SSL errors with helpful guidance."""
-        print("\n" + "="*60)
-        print("🔒 Connection/SSL Error")
-        print("="*60)
-        print("Failed to connect to OpenAI API due to network/SSL issues.")
-        print("\n💡 Quick fixes:")
-        print("   • Check your internet connection")
-        print("   • Try running: pip install --upgrade certifi")
-        print("   • If using corporate network, check proxy settings")
-        print("   • Temporarily try a different network (mobile hotspot)")
-        print("\n🔄 Alternative options:")
-        print("   • Try Google Veo: --provider google")
-        print("   • Try RunwayML: --provider runway")
-        print("="*60)
+        self._print_banner(_CONNECTION_ERROR_BANNER)
         from ...exceptions import AuthenticationError
         raise AuthenticationError("Connection/SSL error - see instructions above")
     
@@ -276,23 +607,7 @@ class SoraAPIClient:
             "If you've already verified, please wait up to 15 minutes for access to propagate.\n"
             "You can continue using other providers in the meantime."
         )
-        print("\n" + "="*60)
-        print("⚠️  OpenAI Organization Verification Required")
-        print("="*60)
-        print("Your OpenAI organization needs to be verified to use Sora models.")
-        print()
-        print("✅ If you haven't verified yet:")
-        print("   Visit: https://platform.openai.com/settings/organization/general")
-        print("   Click 'Verify Organization'")
-        print()
-        print("⏳ If you've already verified:")
-        print("   Please wait up to 15 minutes for access to propagate")
-        print("   Then try again with the same command")
-        print()
-        print("🔄 Alternative options while waiting:")
-        print("   • Try Google Veo: --provider google")
-        print("   • Try RunwayML: --provider runway")
-        print("="*60)
+        self._print_banner(_ORGANIZATION_VERIFICATION_BANNER)
         from ...exceptions import AuthenticationError
         raise AuthenticationError(
             "OpenAI organization verification required. "
@@ -301,17 +616,7 @@ class SoraAPIClient:
     
     def _handle_invalid_duration_error(self, duration_seconds: int) -> None:
         """Handle invalid duration errors with helpful guidance."""
-        print("\n" + "="*60)
-        print("⚠️  Invalid Duration Parameter")
-        print("="*60)
-        print(f"You requested {duration_seconds} seconds, but OpenAI Sora only supports:")
-        print("   • 4 seconds  (--duration 4)")
-        print("   • 8 seconds  (--duration 8)")
-        print("   • 12 seconds (--duration 12)")
-        print()
-        print("🔄 Please try again with a supported duration:")
-        print("   ./image2video.py --provider openai --duration 8 [other options]")
-        print("="*60)
+        self._print_banner(_INVALID_DURATION_BANNER.format(duration_seconds=duration_seconds))
         raise RuntimeError(
             f"Invalid duration: {duration_seconds}s. OpenAI Sora only supports 4, 8, or 12 seconds."
         )
@@ -349,8 +654,7 @@ class SoraAPIClient:
         # Try to get available models from the API
         available_models = []
         try:
-            models = self.client.models.list()
-            available_models = [m.id for m in models.data if m.id.startswith("sora")]
+            available_models = _get_sora_models(self.client, self.config.api_key)
         except Exception:
             # Fall back to common models if API query fails
             available_models = ["sora-2", "sora-2-pro"]
@@ -386,17 +690,129 @@ class SoraAPIClient:
         
         raise RuntimeError(error_msg)
     
-    def _handle_capacity_retry(self, retry_count: int) -> None:
+    def _handle_capacity_retry(
+        self,
+        retry_count: int,
+        server_hint: Optional[float] = None,
+        delay_budget: Optional[float] = None
+    ) -> float:
         """
         Handle capacity retry with exponential backoff.
         
         Args:
             retry_count: Current retry attempt number
+            server_hint: Delay in seconds requested by the server, if any
+            delay_budget: Remaining wait time allowed across all retries
+            
+        Returns:
+            Number of seconds waited
             
         Raises:
-            RuntimeError: If user cancels during backoff
+            RuntimeError: If user cancels during backoff or cancel() is called
+        """
+        return handle_capacity_retry(
+            retry_count, self.config, self.logger, server_hint, delay_budget, self._cancel_event
+        )
+    
+    def _get_retry_after_hint(self, error: Exception) -> Optional[float]:
+        """
+        Extract the server-requested retry delay from an API error.
+        
+        Checks the Retry-After response header first, then falls back to a
+        "retry after N seconds" hint in the error message.
+        
+        Args:
+            error: Exception raised by the API call
+            
+        Returns:
+            Delay in seconds, or None if the server gave no hint
+        """
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is not None:
+            retry_after = headers.get("retry-after")
+            if retry_after:
+                try:
+                    return float(retry_after)
+                except ValueError:
+                    pass  # HTTP-date form; fall back to the message
+        
+        match = _RETRY_AFTER_RE.search(str(error))
+        if match:
+            return float(match.group(1))
+        return None
+    
+    def _is_transient_poll_error(self, error: Exception) -> bool:
+        """
+        Determine if a status-retrieval error is worth retrying.
+        
+        Only connection problems, server-side (5xx) failures and capacity
+        errors are transient; authentication errors, unknown job IDs and
+        other client errors will never recover and must not be retried.
+        
+        Args:
+            error: Exception raised while retrieving the job status
+            
+        Returns:
+            True if polling should continue, False otherwise
+        """
+        if isinstance(error, (openai.APIConnectionError, openai.InternalServerError)):
+            return True
+        return self._should_retry_error(error)
+    
+    def _record_poll_error(self, job_id: str, error: Exception, consecutive_errors: int) -> int:
+        """
+        Account for a failed status retrieval and decide whether to keep polling.
+        
+        Args:
+            job_id: ID of the job being polled
+            error: Exception raised while retrieving the job status
+            consecutive_errors: Number of consecutive errors before this one
+            
+        Returns:
+            Updated consecutive error count
+            
+        Raises:
+            RuntimeError: If the error is permanent or the error budget is spent
+        """
+        if not self._is_transient_poll_error(error):
+            self.logger.error(f"Error retrieving job status for {job_id}: {error}")
+            raise RuntimeError(f"Polling job {job_id} failed: {error}") from error
+        
+        consecutive_errors += 1
+        if consecutive_errors >= self.config.poll_max_consecutive_errors:
+            self.logger.error(
+                f"Giving up on job {job_id} after {consecutive_errors} consecutive polling errors"
+            )
+            raise RuntimeError(
+                f"Polling job {job_id} failed after {consecutive_errors} consecutive errors: {error}"
+            ) from error
+        
+        self.logger.debug(
+            "Transient error retrieving job status: %s, will retry (%d/%d)",
+            error, consecutive_errors, self.config.poll_max_consecutive_errors
+        )
+        return consecutive_errors
+    
+    def _get_poll_delay(self, poll_count: int) -> float:
+        """
+        Get the wait before the next status check.
+        
+        Doubles from poll_base_interval up to poll_max_interval, with jitter so
+        many clients polling at once don't hit the API in lockstep.
+        
+        Args:
+            poll_count: Number of status checks made so far
+            
+        Returns:
+            Delay in seconds
         """
-        handle_capacity_retry(retry_count, self.config, self.logger)
+        return calculate_retry_delay(
+            poll_count + 1,
+            self.config.poll_base_interval,
+            self.config.poll_max_interval,
+            self.config.retry_jitter_percent
+        )
     
     def poll_async_job(self, response: Any) -> Any:
         """
@@ -409,26 +825,32 @@ class SoraAPIClient:
             Completed response object
             
         Raises:
-            RuntimeError: If job fails or cannot retrieve status
+            RuntimeError: If job fails, a non-transient polling error occurs,
+                too many consecutive polling errors occur, or cancel() is called
         """
         job_id = response.id
-        self.logger.info(f"Polling async video job: {job_id}")
+        self.logger.info("Polling async video job: %s", job_id)
         
         status = getattr(response, "status", None) or "queued"
         last_state = None
         
-        while status not in {"completed", "failed", "cancelled"}:
+        consecutive_errors = 0
+        poll_count = 0
+        
+        while status not in _TERMINAL_STATUSES:
             if status != last_state:
-                self.logger.info(f"Job status: {status}")
+                self.logger.info("Job status: %s", status)
                 last_state = status
-            time.sleep(3)  # Poll every 3 seconds
+            self._wait(self._get_poll_delay(poll_count))
+            poll_count += 1
             
             try:
                 self.logger.debug("Retrieving video job status")
                 response = self.client.videos.retrieve(job_id)
                 status = getattr(response, "status", None) or "queued"
+                consecutive_errors = 0
             except Exception as e:
-                self.logger.debug(f"Error retrieving job status: {e}, will retry")
+                consecutive_errors = self._record_poll_error(job_id, e, consecutive_errors)
                 continue
         
         if status != "completed":
@@ -438,37 +860,145 @@ class SoraAPIClient:
         self.logger.info("Video job completed successfully")
         return response
     
+    def poll_many(self, responses: List[Any]) -> List[Any]:
+        """
+        Poll several asynchronous jobs until they all finish.
+        
+        Synchronous wrapper around poll_many_async.
+        
+        Args:
+            responses: Initial API responses with job IDs
+            
+        Returns:
+            Final job objects, in the order of ``responses``
+        """
+        return asyncio.run(self.poll_many_async(responses))
+    
+    async def poll_many_async(self, responses: List[Any]) -> List[Any]:
+        """
+        Poll several asynchronous jobs from a single loop.
+        
+        Each tick sleeps once and then retrieves the status of every pending
+        job concurrently, instead of running one sleep/retrieve loop per job.
+        Unlike poll_async_job, jobs ending in "failed" or "cancelled" are
+        returned rather than raised so one failure does not discard the rest;
+        callers should check each job's ``status``.
+        
+        Args:
+            responses: Initial API responses with job IDs
+            
+        Returns:
+            Final job objects, in the order of ``responses``
+            
+        Raises:
+            RuntimeError: If a non-transient polling error occurs, or too many
+                consecutive polling errors occur for one job
+        """
+        async_client = self._get_async_client()
+        done: Dict[str, Any] = {}
+        pending: Dict[str, Any] = {}
+        consecutive_errors: Dict[str, int] = {}
+        
+        for response in responses:
+            status = getattr(response, "status", None) or "queued"
+            if status in _TERMINAL_STATUSES:
+                done[response.id] = response
+            else:
+                pending[response.id] = response
+                consecutive_errors[response.id] = 0
+        
+        self.logger.info("Polling %d async video jobs", len(pending))
+        
+        poll_count = 0
+        while pending:
+            await asyncio.sleep(self._get_poll_delay(poll_count))
+            if self._cancel_event.is_set():
+                raise RuntimeError("Operation cancelled")
+            poll_count += 1
+            
+            job_ids = list(pending)
+            results = await asyncio.gather(
+                *[async_client.videos.retrieve(job_id) for job_id in job_ids],
+                return_exceptions=True
+            )
+            
+            for job_id, result in zip(job_ids, results):
+                if isinstance(result, Exception):
+                    consecutive_errors[job_id] = self._record_poll_error(
+                        job_id, result, consecutive_errors[job_id]
+                    )
+                    continue
+                
+                consecutive_errors[job_id] = 0
+                status = getattr(result, "status", None) or "queued"
+                if status in _TERMINAL_STATUSES:
+                    self.logger.info("Job %s finished with status: %s", job_id, status)
+                    done[job_id] = result
+                    del pending[job_id]
+        
+        return [done[response.id] for response in responses]
+    
     def download_video(self, video_id: str, output_path: str) -> None:
         """
         Download a video file from OpenAI.
         
+        The content is streamed to disk over the shared client's connection
+        pool, so memory use stays at one chunk regardless of video size.
+        
         Args:
             video_id: OpenAI video job ID  
             output_path: Local path to save the video
+            
+        Raises:
+            RuntimeError: If the download fails
         """
-        self.logger.info(f"Downloading video: {video_id}")
+        self.logger.info("Downloading video: %s", video_id)
         
         try:
-            # Use direct HTTP request for video content download
-            import httpx
-            headers = {"Authorization": f"Bearer {self.config.api_key}"}
-            
-            self.logger.debug(f"Downloading from: https://api.openai.com/v1/videos/{video_id}/content")
-            response = httpx.get(
-                f"https://api.openai.com/v1/videos/{video_id}/content",
-                headers=headers,
+            bytes_written = 0
+            with self.client.videos.with_streaming_response.download_content(
+                video_id,
                 timeout=300  # 5 minute timeout for large video downloads
-            )
-            response.raise_for_status()
+            ) as response:
+                # Chunks larger than the file buffer bypass BufferedWriter's internal copy
+                with open(output_path, "wb") as f:
+                    for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        bytes_written += len(chunk)
             
-            blob = response.content
-            self.logger.debug(f"Writing video to: {output_path} ({len(blob)} bytes)")
+            self.logger.debug("Wrote video to: %s (%d bytes)", output_path, bytes_written)
+            self.logger.info("Video downloaded successfully: %s", output_path)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to download video {video_id}: {e}")
+            raise RuntimeError(f"Failed to download video: {e}")
+    
+    async def download_video_async(self, video_id: str, output_path: str) -> None:
+        """
+        Async variant of download_video for use alongside poll_many_async.
+        
+        Args:
+            video_id: OpenAI video job ID
+            output_path: Local path to save the video
             
-            # Save video to specified output path
-            with open(output_path, "wb") as f:
-                f.write(blob)
+        Raises:
+            RuntimeError: If the download fails
+        """
+        self.logger.info("Downloading video: %s", video_id)
+        
+        try:
+            bytes_written = 0
+            async with self._get_async_client().videos.with_streaming_response.download_content(
+                video_id,
+                timeout=300
+            ) as response:
+                with open(output_path, "wb") as f:
+                    async for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        bytes_written += len(chunk)
             
-            self.logger.info(f"Video downloaded successfully: {output_path}")
+            self.logger.debug("Wrote video to: %s (%d bytes)", output_path, bytes_written)
+            self.logger.info("Video downloaded successfully: %s", output_path)
             
         except Exception as e:
             self.logger.error(f"Failed to download video {video_id}: {e}")
@@ -3,12 +3,38 @@ RunwayML Aleph video editing and generation functions.
 
 This module provides video editing capabilities using RunwayML's Aleph model.
 """
+from dataclasses import astuple
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 from ..config import RunwayConfig
-from ..providers import RunwayAlephClient
 from ..logger import get_library_logger
+from ..artifact_manager import get_artifact_manager
+
+if TYPE_CHECKING:
+    from .runway_provider import RunwayAlephClient
+
+# Aleph clients shared across calls, keyed by the full configuration
+_aleph_clients: Dict[Tuple, "RunwayAlephClient"] = {}
+
+
+def _get_aleph_client(config: RunwayConfig) -> "RunwayAlephClient":
+    """
+    Get the shared Aleph client for a configuration, creating it on first use.
+    
+    Args:
+        config: RunwayML configuration
+        
+    Returns:
+        RunwayAlephClient reused by every call with an equal configuration
+    """
+    key = astuple(config)
+    client = _aleph_clients.get(key)
+    if client is None:
+        # Imported on first use; most callers never edit with Aleph
+        from .runway_provider.aleph_client import RunwayAlephClient
+        client = _aleph_clients[key] = RunwayAlephClient(config)
+    return client
 
 
 def edit_video_with_runway_aleph(
@@ -31,7 +57,8 @@ def edit_video_with_runway_aleph(
     
     Args:
         prompt: Text description of the desired transformation/editing
-        video_path: Path to the input video file to edit
+        video_path: Path to the input video file to edit, or an HTTPS URL
+            that Runway fetches directly
         width: Video width in pixels. Defaults to 1280.
         height: Video height in pixels. Defaults to 720.
         duration_seconds: Video duration in seconds (2-30). Defaults to 5.
@@ -73,7 +100,7 @@ def edit_video_with_runway_aleph(
     
     # Step 2: Initialize Aleph API client
     logger.debug("Initializing RunwayML Aleph API client")
-    api_client = RunwayAlephClient(config)
+    api_client = _get_aleph_client(config)
     
     # Step 3: Generate default output path if not provided
     if out_path is None:
@@ -81,8 +108,8 @@ def edit_video_with_runway_aleph(
         out_path = f"{input_name}_aleph_edited.mp4"
     
     # Step 4: Edit video
-    logger.info(f"Editing video: {video_path}")
-    logger.info(f"Transformation prompt: {prompt}")
+    logger.info("Editing video: %s", video_path)
+    logger.info("Transformation prompt: %s", prompt)
     
     video_output_path = api_client.edit_video(
         prompt=prompt,
@@ -95,7 +122,6 @@ def edit_video_with_runway_aleph(
     )
     
     # Step 5: Track artifact
-    from ..artifact_manager import get_artifact_manager
     artifact_manager = get_artifact_manager()
     
     artifact_manager.track_artifact(
@@ -109,7 +135,7 @@ def edit_video_with_runway_aleph(
         duration_seconds=duration_seconds,
     )
     
-    logger.info(f"Video editing complete: {video_output_path}")
+    logger.info("Video editing complete: %s", video_output_path)
     return video_output_path
 
 
@@ -172,7 +198,7 @@ def generate_video_with_runway_aleph(
     
     # Step 2: Initialize Aleph API client
     logger.debug("Initializing RunwayML Aleph API client")
-    api_client = RunwayAlephClient(config)
+    api_client = _get_aleph_client(config)
     
     # Step 3: Generate default output path if not provided
     if out_path is None:
@@ -180,9 +206,9 @@ def generate_video_with_runway_aleph(
     
     # Step 4: Generate video
     logger.info("Generating video with Aleph model")
-    logger.info(f"Prompt: {prompt}")
+    logger.info("Prompt: %s", prompt)
     if image_path:
-        logger.info(f"Using image reference: {image_path}")
+        logger.info("Using image reference: %s", image_path)
     
     video_output_path = api_client.generate_video(
         prompt=prompt,
@@ -195,7 +221,6 @@ def generate_video_with_runway_aleph(
     )
     
     # Step 5: Track artifact
-    from ..artifact_manager import get_artifact_manager
     artifact_manager = get_artifact_manager()
     
     artifact_manager.track_artifact(
@@ -209,5 +234,5 @@ def generate_video_with_runway_aleph(
         duration_seconds=duration_seconds,
     )
     
-    logger.info(f"Video generation complete: {video_output_path}")
+    logger.info("Video generation complete: %s", video_output_path)
     return video_output_path
\ No newline at end of file
@@ -4,18 +4,140 @@ RunwayML video generation module.
 This module provides video generation capabilities using RunwayML's Gen-4 models
 and Google Veo models via RunwayML's API.
 """
-import time
+import asyncio
+import os
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import astuple
 from pathlib import Path
-from typing import Iterable, Union, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Union, List, Optional, Sequence, Tuple
 
 from ..config import RunwayConfig
-from ..providers import RunwayGen4Client, RunwayVeoClient
+from .runway_provider.config import GEN4_DURATIONS
 from ..logger import get_library_logger
+from ..artifact_manager import get_artifact_manager
 
+if TYPE_CHECKING:
+    from .runway_provider import RunwayGen4Client, RunwayVeoClient
 
-def _route_to_veo_if_needed(
+# API clients shared across calls, keyed by the full configuration
+_gen4_clients: Dict[Tuple, "RunwayGen4Client"] = {}
+_veo_clients: Dict[Tuple, "RunwayVeoClient"] = {}
+
+
+def _get_gen4_client(config: RunwayConfig) -> "RunwayGen4Client":
+    """Get the shared Gen-4 client for a configuration, creating it on first use."""
+    key = astuple(config)
+    client = _gen4_clients.get(key)
+    if client is None:
+        # Imported on first use so Veo-only callers never load the Gen-4 client
+        from .runway_provider.gen4_client import RunwayGen4Client
+        client = _gen4_clients[key] = RunwayGen4Client(config)
+    return client
+
+
+def _get_veo_client(config: RunwayConfig) -> "RunwayVeoClient":
+    """Get the shared Veo client for a configuration, creating it on first use."""
+    key = astuple(config)
+    client = _veo_clients.get(key)
+    if client is None:
+        # Imported on first use so Gen-4-only callers never load the Veo client
+        from .runway_provider.veo3_client import RunwayVeoClient
+        client = _veo_clients[key] = RunwayVeoClient(config)
+    return client
+
+
+# Finished clips downloaded at once by generate_videos_with_runway
+_MAX_PARALLEL_DOWNLOADS = 4
+
+# Artifact records are written off the caller's thread, one at a time and in
+# order. Pending writes still complete before the interpreter exits.
+_artifact_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="runway-artifacts")
+
+
+def _log_tracking_failure(future: Future) -> None:
+    """Report an artifact write that failed in the background."""
+    error = future.exception()
+    if error is not None:
+        get_library_logger().warning(f"Failed to record RunwayML artifact: {error}")
+
+
+def _track_artifact(
+    model: str,
     prompt: str,
-    file_paths: Iterable[Union[str, Path]],
+    video_path: Optional[str],
+    width: int,
+    height: int,
+    duration_seconds: int,
+    task_id: Optional[str] = None,
+    download_url: Optional[str] = None
+) -> Future:
+    """
+    Record a generated video with the artifact manager without blocking.
+    
+    Args:
+        model: Model used for generation
+        prompt: Generation prompt
+        video_path: Path of the saved video, or None for a task that is
+            still rendering. Recording the same task_id again replaces the
+            entry, so a task can be recorded on submission and again once
+            it is downloaded.
+        width: Video width in pixels
+        height: Video height in pixels
+        duration_seconds: Video duration in seconds
+        task_id: RunwayML task ID. A unique local ID is generated if None.
+        download_url: URL the video was downloaded from
+        
+    Returns:
+        Future that completes once the artifact is saved
+    """
+    if task_id is None:
+        task_id = f"runway_{model}_{uuid.uuid4().hex[:12]}"
+    
+    metadata = {"width": width, "height": height, "duration_seconds": duration_seconds}
+    if video_path is not None:
+        metadata["file_path"] = video_path
+    
+    # Resolved now so the write goes to the manager current at submit time
+    manager = get_artifact_manager()
+    future = _artifact_executor.submit(
+        manager.add_artifact,
+        task_id=task_id,
+        provider="runway",
+        model=model,
+        prompt=prompt,
+        download_url=download_url,
+        metadata=metadata
+    )
+    future.add_done_callback(_log_tracking_failure)
+    return future
+
+
+def _check_image_files(paths: Iterable[Optional[str]]) -> None:
+    """
+    Check that every image input exists before any of them is encoded.
+    
+    Args:
+        paths: Image paths to check; None entries are skipped
+        
+    Raises:
+        FileNotFoundError: Listing every missing file
+    """
+    missing = [str(path) for path in paths if path and not os.path.isfile(path)]
+    if missing:
+        raise FileNotFoundError(f"Image file not found: {', '.join(missing)}")
+
+
+def _to_file_list(file_paths: Optional[Iterable[Union[str, Path]]]) -> Sequence[Union[str, Path]]:
+    """Materialize file_paths once; lists and tuples are used as-is."""
+    if isinstance(file_paths, (list, tuple)):
+        return file_paths
+    return list(file_paths or ())
+
+
+def _route_to_veo(
+    prompt: str,
+    file_list: Sequence[Union[str, Path]],
     reference_images: Optional[List[str]],
     first_frame: Optional[str],
     selected_model: str,
@@ -25,16 +147,13 @@ def _route_to_veo_if_needed(
     seed: Optional[int],
     out_path: Optional[str],
     config: RunwayConfig
-) -> Optional[str]:
-    """Route VEO models to the appropriate function, return None for Gen-4 models."""
-    if not selected_model or not selected_model.startswith("veo"):
-        return None
-    
-    # Use reference_images if provided, otherwise convert file_paths
+) -> str:
+    """Generate with a Veo model through generate_video_with_runway_veo."""
+    # Use reference_images if provided, otherwise convert file_list
     if reference_images:
         ref_images = reference_images
     else:
-        ref_images = [str(path) for path in file_paths] if file_paths else []
+        ref_images = [str(path) for path in file_list]
     
     return generate_video_with_runway_veo(
         prompt=prompt,
@@ -50,19 +169,43 @@ def _route_to_veo_if_needed(
     )
 
 
+# Default output file for each known Veo model
+_VEO_DEFAULT_OUT: Dict[str, str] = {
+    model: f"runway_veo_{model.replace('.', '_')}_output.mp4"
+    for model in RunwayConfig.SUPPORTED_MODELS
+    if model.startswith("veo")
+}
+
+
+# Model-name prefixes served by a dedicated generation path; anything else is
+# a Gen-4 model. Routes share _route_to_veo's signature.
+_MODEL_ROUTES: Dict[str, Callable[..., str]] = {
+    "veo": _route_to_veo,
+}
+
+
+def _find_model_route(selected_model: str) -> Optional[Callable[..., str]]:
+    """Return the generation path for a model, or None for Gen-4 models."""
+    if not selected_model:
+        return None
+    return next(
+        (route for prefix, route in _MODEL_ROUTES.items() if selected_model.startswith(prefix)),
+        None
+    )
+
+
 def _prepare_gen4_inputs(
-    file_paths: Iterable[Union[str, Path]],
+    file_list: Sequence[Union[str, Path]],
     out_path: Optional[str],
     duration_seconds: int
 ) -> tuple[Optional[str], str, int]:
     """Prepare inputs for Gen-4 model generation."""
     # Prepare image input (only first image supported)
     image_path = None
-    if file_paths:
-        file_list = list(file_paths)
+    if file_list:
         if len(file_list) > 1:
             logger = get_library_logger()
-            logger.warning(f"RunwayML Gen-4 only supports 1 image reference. Using first of {len(file_list)} provided.")
+            logger.warning("RunwayML Gen-4 only supports 1 image reference. Using first of %d provided.", len(file_list))
         image_path = str(file_list[0])
     
     # Generate default output path if not provided
@@ -70,7 +213,7 @@ def _prepare_gen4_inputs(
         out_path = "runway_gen4_output.mp4"
     
     # Validate duration for Gen-4 models (must be 5 or 10)
-    if duration_seconds not in [5, 10]:
+    if duration_seconds not in GEN4_DURATIONS:
         duration_seconds = 5
     
     return image_path, out_path, duration_seconds
@@ -138,28 +281,31 @@ def generate_video_with_runway(
     # Use specified model or default from config
     selected_model = model if model is not None else config.default_model
     
-    # Route VEO models to the appropriate function
-    veo_result = _route_to_veo_if_needed(
-        prompt, file_paths, reference_images, first_frame, selected_model,
-        width, height, duration_seconds, seed, out_path, config
-    )
-    if veo_result is not None:
-        return veo_result
+    # Consume file_paths once; both the Veo and Gen-4 paths read the list
+    file_list = _to_file_list(file_paths)
+    
+    # Route non-Gen-4 models (e.g. Veo) to their own generation path
+    route = _find_model_route(selected_model)
+    if route is not None:
+        return route(
+            prompt, file_list, reference_images, first_frame, selected_model,
+            width, height, duration_seconds, seed, out_path, config
+        )
     
     # Prepare Gen-4 inputs
     image_path, out_path, duration_seconds = _prepare_gen4_inputs(
-        file_paths, out_path, duration_seconds
+        file_list, out_path, duration_seconds
     )
     
     if image_path:
-        logger.info(f"Using image reference: {image_path}")
+        logger.info("Using image reference: %s", image_path)
     
     # Step 2: Initialize API client and generate video
     logger.debug("Initializing RunwayML Gen-4 API client")
-    api_client = RunwayGen4Client(config)
+    api_client = _get_gen4_client(config)
     
     # Step 3: Generate video
-    logger.info(f"Using RunwayML model: {selected_model}")
+    logger.info("Using RunwayML model: %s", selected_model)
     
     video_path = api_client.generate_video(
         prompt=prompt,
@@ -173,26 +319,184 @@ def generate_video_with_runway(
     )
     
     # Step 4: Track artifact
-    from ..artifact_manager import get_artifact_manager
-    artifact_manager = get_artifact_manager()
-    
-    artifact_manager.add_artifact(
-        task_id=f"runway_{selected_model}_{int(time.time())}",
-        provider="runway",
-        model=selected_model,
-        prompt=prompt,
-        metadata={
-            "width": width,
-            "height": height,
-            "duration_seconds": duration_seconds,
-            "file_path": video_path
-        }
-    )
+    _track_artifact(selected_model, prompt, video_path, width, height, duration_seconds)
     
-    logger.info(f"Video generation complete: {video_path}")
+    logger.info("Video generation complete: %s", video_path)
     return video_path
 
 
+async def generate_video_with_runway_async(
+    prompt: str,
+    file_paths: Iterable[Union[str, Path]] = (),
+    **kwargs: Any
+) -> str:
+    """
+    Async variant of generate_video_with_runway.
+    
+    The generation runs on a worker thread, so several clips awaited together
+    (e.g. with ``asyncio.gather``) submit and poll concurrently instead of one
+    after another. They share the pooled Runway HTTP session.
+    
+    Args:
+        prompt: Text description of the desired video content
+        file_paths: Paths to image files for reference. Only first image is used.
+        **kwargs: Keyword arguments accepted by generate_video_with_runway
+        
+    Returns:
+        Path to the saved video file
+        
+    Raises:
+        Same as generate_video_with_runway
+        
+    Examples:
+        >>> video_paths = await asyncio.gather(
+        ...     generate_video_with_runway_async("A lake at dawn", out_path="dawn.mp4"),
+        ...     generate_video_with_runway_async("A lake at dusk", out_path="dusk.mp4"),
+        ... )
+    """
+    return await asyncio.to_thread(generate_video_with_runway, prompt, file_paths, **kwargs)
+
+
+def generate_videos_with_runway(
+    prompts: List[str],
+    file_paths: Iterable[Union[str, Path]] = (),
+    *,
+    model: Optional[str] = None,
+    width: int = 1280,
+    height: int = 720,
+    duration_seconds: int = 5,
+    seed: Optional[int] = None,
+    out_paths: Optional[List[str]] = None,
+    config: Optional[RunwayConfig] = None
+) -> List[str]:
+    """
+    Generate several videos with RunwayML's Gen-4 models.
+    
+    All tasks are submitted back-to-back and then polled together, one status
+    check per task per round, so N clips cost one shared poll loop instead of
+    N sequential submit-and-wait cycles. Finished clips are downloaded in
+    parallel. Veo models are generated one at a
+    time through generate_video_with_runway_veo.
+    
+    Args:
+        prompts: Text descriptions, one per video
+        file_paths: Paths to image files for reference, shared by every prompt.
+            Only first image is used.
+        model: Model to use. Defaults to None (uses config default).
+        width: Video width in pixels. Defaults to 1280.
+        height: Video height in pixels. Defaults to 720.
+        duration_seconds: Video duration in seconds (5 or 10). Defaults to 5.
+        seed: Random seed for reproducible results. Defaults to None.
+        out_paths: Output file paths, one per prompt. Auto-generated if None.
+        config: RunwayML configuration. If None, loads from environment.
+        
+    Returns:
+        Paths to the saved video files, in the order of ``prompts``
+        
+    Raises:
+        ValueError: If configuration is invalid or out_paths doesn't match prompts
+        RuntimeError: If API calls fail or any task or download fails;
+            videos from the tasks that succeeded are still downloaded and
+            recorded first
+        
+    Examples:
+        >>> video_paths = generate_videos_with_runway(
+        ...     ["A lake at dawn", "The same lake at dusk"],
+        ...     file_paths=["lake.jpg"]
+        ... )
+    """
+    logger = get_library_logger()
+    logger.info("Generating %d videos with RunwayML", len(prompts))
+    
+    if out_paths is not None and len(out_paths) != len(prompts):
+        raise ValueError(f"Got {len(out_paths)} output paths for {len(prompts)} prompts")
+    
+    if config is None:
+        logger.debug("Loading RunwayML config from environment")
+        config = RunwayConfig.from_environment()
+    
+    selected_model = model if model is not None else config.default_model
+    
+    file_list = _to_file_list(file_paths)
+    if _find_model_route(selected_model) is not None:
+        return [
+            generate_video_with_runway(
+                prompt, file_list, model=selected_model, width=width, height=height,
+                duration_seconds=duration_seconds, seed=seed,
+                out_path=out_paths[i] if out_paths else None, config=config
+            )
+            for i, prompt in enumerate(prompts)
+        ]
+    
+    image_path, _, duration_seconds = _prepare_gen4_inputs(file_list, None, duration_seconds)
+    if out_paths is None:
+        out_paths = [f"runway_gen4_output_{i}.mp4" for i in range(1, len(prompts) + 1)]
+    
+    api_client = _get_gen4_client(config)
+    
+    # Submit every task before waiting on any of them. Each is recorded as
+    # soon as it exists, so an interrupted run leaves resumable task IDs
+    task_ids = []
+    for prompt in prompts:
+        task_response = api_client.create_image_to_video_task(
+            prompt=prompt,
+            image_path=image_path,
+            width=width,
+            height=height,
+            duration=duration_seconds,
+            model=selected_model,
+            seed=seed
+        )
+        task_id = task_response.get("id")
+        if not task_id:
+            raise RuntimeError("No task ID in response")
+        task_ids.append(task_id)
+        _track_artifact(selected_model, prompt, None, width, height, duration_seconds, task_id=task_id)
+    
+    completed_tasks = api_client.poll_tasks(task_ids)
+    
+    # Download the finished clips concurrently, each over its own pooled
+    # connection. Each clip is recorded as its own download finishes, and
+    # one failed download does not stop the rest from being recorded
+    downloads: Dict[Future, Tuple[int, str, str, str]] = {}
+    downloaded: Dict[int, str] = {}
+    failures = []
+    with ThreadPoolExecutor(
+        max_workers=_MAX_PARALLEL_DOWNLOADS, thread_name_prefix="runway-downloads"
+    ) as download_pool:
+        for i, (prompt, out_path, task) in enumerate(zip(prompts, out_paths, completed_tasks)):
+            output_urls = task.get("output") or []
+            if task.get("status") != "SUCCEEDED" or not output_urls:
+                reason = task.get("failure", {}).get("reason", task.get("status"))
+                failures.append(f"{task.get('id')}: {reason}")
+                continue
+            
+            future = download_pool.submit(api_client.download_video, output_urls[0], out_path)
+            downloads[future] = (i, prompt, task["id"], output_urls[0])
+        
+        for future in as_completed(downloads):
+            i, prompt, task_id, url = downloads[future]
+            try:
+                video_path = future.result()
+            except Exception as e:
+                failures.append(f"{task_id}: {e}")
+                continue
+            _track_artifact(
+                selected_model, prompt, video_path, width, height, duration_seconds,
+                task_id=task_id, download_url=url
+            )
+            downloaded[i] = video_path
+    
+    # Results are still returned in prompt order
+    video_paths = [downloaded[i] for i in sorted(downloaded)]
+    
+    if failures:
+        raise RuntimeError(f"{len(failures)} of {len(prompts)} RunwayML clips failed: {'; '.join(failures)}")
+    
+    logger.info("Generated %d videos", len(video_paths))
+    return video_paths
+
+
 def generate_video_with_runway_veo(
     prompt: str,
     reference_images: Optional[List[str]] = None,
@@ -269,7 +573,7 @@ def generate_video_with_runway_veo(
     
     # Step 2: Initialize Veo API client
     logger.debug("Initializing RunwayML Veo API client")
-    api_client = RunwayVeoClient(config)
+    api_client = _get_veo_client(config)
     
     # Step 3: Validate Veo model
     if not model:
@@ -278,17 +582,20 @@ def generate_video_with_runway_veo(
     if not model.startswith("veo"):
         raise ValueError(f"This function is for Veo models only. Got: {model}")
     
+    # Fail fast on missing images rather than after encoding the first ones
+    _check_image_files([first_frame, *(reference_images or ())])
+    
     # Step 4: Validate duration (Veo supports 2-10 seconds)
     if not (2 <= duration_seconds <= 10):
-        logger.warning(f"Duration {duration_seconds}s not in range 2-10. Clamping to 5 seconds.")
+        logger.warning("Duration %ss not in range 2-10. Clamping to 5 seconds.", duration_seconds)
         duration_seconds = 5
     
     # Step 5: Generate default output path if not provided
     if out_path is None:
-        out_path = f"runway_veo_{model.replace('.', '_')}_output.mp4"
+        out_path = _VEO_DEFAULT_OUT.get(model) or f"runway_veo_{model.replace('.', '_')}_output.mp4"
     
     # Step 6: Generate video
-    logger.info(f"Using RunwayML Veo model: {model}")
+    logger.info("Using RunwayML Veo model: %s", model)
     
     video_path = api_client.generate_video(
         prompt=prompt,
@@ -302,21 +609,7 @@ def generate_video_with_runway_veo(
     )
     
     # Step 7: Track artifact
-    from ..artifact_manager import get_artifact_manager
-    artifact_manager = get_artifact_manager()
-    
-    artifact_manager.add_artifact(
-        task_id=f"runway_{model}_{int(time.time())}",
-        provider="runway",
-        model=model,
-        prompt=prompt,
-        metadata={
-            "width": width,
-            "height": height,
-            "duration_seconds": duration_seconds,
-            "file_path": video_path
-        }
-    )
+    _track_artifact(model, prompt, video_path, width, height, duration_seconds)
     
-    logger.info(f"Video generation complete: {video_path}")
+    logger.info("Video generation complete: %s", video_path)
     return video_path
\ No newline at end of file
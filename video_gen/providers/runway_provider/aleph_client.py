@@ -10,9 +10,8 @@ Handles API calls for RunwayML's Aleph model which specializes in:
 """
 
 import time
-import base64
-import sys
-from typing import Dict, Any, Optional, List
+import json
+from typing import Dict, Any, Iterator, Optional, List, Tuple, Union
 from pathlib import Path
 
 try:
@@ -20,12 +19,113 @@ try:
 except ImportError:
     requests = None
 
-from .config import RunwayConfig
+from .config import RunwayConfig, PLACEHOLDER_API_KEYS
+from .encoding import base64_chunks, base64_length, data_uri_prefix, encode_file_data_uri
+from .session import download_to_file, dumps_json, get_session, loads_json
 from ...exceptions import InsufficientCreditsError
 from ...logger import get_library_logger
+from ...retry_utils import calculate_retry_delay
+
+# Task creation is retried on rate limiting and transient server errors
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_TASK_CREATE_MAX_ATTEMPTS = 4
+
+# Bytes of an error response body included in logs
+_ERROR_BODY_LOG_LIMIT = 8192
+
+# MIME types by file suffix, with the fallback used for anything else
+_IMAGE_MIME_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.webp': 'image/webp',
+    '.gif': 'image/gif',
+    '.bmp': 'image/bmp',
+    '.tif': 'image/tiff',
+    '.tiff': 'image/tiff',
+}
+_VIDEO_MIME_TYPES = {
+    '.mp4': 'video/mp4',
+    '.m4v': 'video/mp4',
+    '.mov': 'video/quicktime',
+    '.webm': 'video/webm',
+    '.mkv': 'video/x-matroska',
+    '.avi': 'video/x-msvideo',
+}
+
+
+def _json_field_head(payload: Dict[str, Any], field: str) -> bytes:
+    """Serialize payload with ``field`` appended and left open for its string value."""
+    return (json.dumps(payload)[:-1] + f', {json.dumps(field)}: "').encode('ascii')
+
+
+def _json_with_field(payload: Dict[str, Any], field: str, value: Union[str, bytearray]) -> bytes:
+    """
+    Serialize payload with one more string field.
+
+    Encoded data URIs are spliced in as bytes: base64 and MIME types need no
+    JSON escaping, so the large value is neither decoded to str nor scanned
+    by the JSON encoder. Other strings (e.g. URLs) are serialized normally.
+
+    Args:
+        payload: JSON fields other than ``field``; must not be empty
+        field: Name of the field to add
+        value: Field value, as str or as ASCII data URI bytes
+
+    Returns:
+        Request body
+    """
+    if isinstance(value, str):
+        return dumps_json({**payload, field: value})
+    return b"".join((_json_field_head(payload, field), value, b'"}'))
+
+
+def _is_remote(path: str) -> bool:
+    """Return True for HTTPS URLs, which Runway fetches itself."""
+    return isinstance(path, str) and path.startswith("https://")
+
+
+def _retry_after(response) -> Optional[float]:
+    """Return the Retry-After header in seconds, if present and numeric."""
+    value = response.headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class _DataUriJsonBody:
+    """
+    JSON request body with one field sent as a file's base64 data URI.
+
+    The file is encoded chunk by chunk while requests writes the body to the
+    socket, so the encoded video is never held in memory. The exact length
+    is known up front, letting requests send a Content-Length header
+    instead of a chunked body.
+    """
+
+    def __init__(self, payload: Dict[str, Any], field: str, path: Path, mime_type: str):
+        """
+        Args:
+            payload: JSON fields other than ``field``; must not be empty
+            field: Name of the field that holds the data URI
+            path: File to encode into the field
+            mime_type: MIME type for the data URI
+        """
+        # base64 and MIME types need no JSON escaping
+        self._head = _json_field_head(payload, field) + data_uri_prefix(mime_type)
+        self._tail = b'"}'
+        self._path = path
+        self._size = path.stat().st_size
+
+    def __len__(self) -> int:
+        return len(self._head) + base64_length(self._size) + len(self._tail)
 
-# Constants
-REQUESTS_NOT_AVAILABLE_ERROR = "requests library not available"
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        with open(self._path, 'rb') as f:
+            yield from base64_chunks(f, self._size)
+        yield self._tail
 
 
 class RunwayAlephClient:
@@ -45,6 +145,15 @@ class RunwayAlephClient:
         self.logger = get_library_logger()
         self.api_key = config.api_key
         self.base_url = config.base_url
+        self.session = get_session()
+        # Request headers are fixed for the client's lifetime; build them once
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "X-Runway-Version": "2024-11-06"
+        }
+        # Last ETag and task data per polled task, for conditional requests
+        self._task_etags: Dict[str, Tuple[str, Dict[str, Any]]] = {}
 
         # Validate API key
         if not self.api_key:
@@ -55,7 +164,7 @@ class RunwayAlephClient:
             )
         
         # Check for placeholder values
-        if self.api_key in ("your_runway_api_key_here", "your_api_key_here", "sk-..."):
+        if self.api_key in PLACEHOLDER_API_KEYS:
             raise ValueError(
                 "Please replace placeholder RUNWAY_API_KEY with your actual API key.\n"
                 "Get your real API key from: https://app.runwayml.com/settings/api-keys"
@@ -63,13 +172,9 @@ class RunwayAlephClient:
 
     def _get_headers(self) -> Dict[str, str]:
         """Get HTTP headers for API requests."""
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "X-Runway-Version": "2024-11-06"
-        }
+        return self._headers
 
-    def _encode_image(self, image_path: str) -> str:
+    def _encode_image(self, image_path: str) -> bytearray:
         """
         Encode image to base64 for API upload.
         
@@ -77,7 +182,7 @@ class RunwayAlephClient:
             image_path: Path to the image file
             
         Returns:
-            Base64 encoded image data URL
+            Base64 encoded image data URL as ASCII bytes
             
         Raises:
             FileNotFoundError: If image file doesn't exist
@@ -85,24 +190,15 @@ class RunwayAlephClient:
         """
         try:
             path = Path(image_path)
-            if not path.exists():
-                raise FileNotFoundError(f"Image file not found: {image_path}")
+            # Opening the file reports a missing image; no separate exists() check
+            mime_type = _IMAGE_MIME_TYPES.get(path.suffix.lower(), 'image/jpeg')
             
-            with open(path, 'rb') as f:
-                image_data = f.read()
-            
-            import mimetypes
-            mime_type, _ = mimetypes.guess_type(str(path))
-            if not mime_type or not mime_type.startswith('image/'):
-                mime_type = 'image/jpeg'  # fallback
-            
-            encoded = base64.b64encode(image_data).decode('utf-8')
-            return f"data:{mime_type};base64,{encoded}"
+            return encode_file_data_uri(path, mime_type)
             
         except Exception as e:
             raise ValueError(f"Failed to encode image {image_path}: {e}")
 
-    def _encode_video(self, video_path: str) -> str:
+    def _encode_video(self, video_path: str) -> bytearray:
         """
         Encode video to base64 for API upload.
         
@@ -110,30 +206,69 @@ class RunwayAlephClient:
             video_path: Path to the video file
             
         Returns:
-            Base64 encoded video data URL
+            Base64 encoded video data URL as ASCII bytes
             
         Raises:
             FileNotFoundError: If video file doesn't exist
             ValueError: If video encoding fails
         """
         try:
-            path = Path(video_path)
-            if not path.exists():
-                raise FileNotFoundError(f"Video file not found: {video_path}")
+            path, mime_type = self._resolve_video(video_path)
+            return encode_file_data_uri(path, mime_type)
             
-            with open(path, 'rb') as f:
-                video_data = f.read()
+        except Exception as e:
+            raise ValueError(f"Failed to encode video {video_path}: {e}")
+
+    def _resolve_video(self, video_path: str) -> Tuple[Path, str]:
+        """
+        Check that a video exists and determine its MIME type.
+        
+        Args:
+            video_path: Path to the video file
             
-            import mimetypes
-            mime_type, _ = mimetypes.guess_type(str(path))
-            if not mime_type or not mime_type.startswith('video/'):
-                mime_type = 'video/mp4'  # fallback
+        Returns:
+            Tuple of (path, MIME type)
             
-            encoded = base64.b64encode(video_data).decode('utf-8')
-            return f"data:{mime_type};base64,{encoded}"
+        Raises:
+            FileNotFoundError: If video file doesn't exist
+        """
+        path = Path(video_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+        
+        mime_type = _VIDEO_MIME_TYPES.get(path.suffix.lower(), 'video/mp4')
+        
+        return path, mime_type
+
+    def _encode_reference_images(self, reference_images: Optional[List[str]]) -> List[Union[str, bytearray]]:
+        """
+        Encode the reference images that are sent with a task.
+        
+        Tasks carry a single promptImage, so only the first image is read and
+        encoded; the rest are only checked for existence. HTTPS URLs are
+        passed through for Runway to fetch.
+        
+        Args:
+            reference_images: Paths or HTTPS URLs of reference images, if any
             
-        except Exception as e:
-            raise ValueError(f"Failed to encode video {video_path}: {e}")
+        Returns:
+            List holding the first image's data URL or URL, or empty
+            
+        Raises:
+            ValueError: If an image is missing or cannot be encoded
+        """
+        if not reference_images:
+            return []
+        
+        self.logger.info(f"Using {len(reference_images)} reference images")
+        for img_path in reference_images[1:]:
+            if not _is_remote(img_path) and not Path(img_path).exists():
+                raise ValueError(f"Failed to encode image {img_path}: Image file not found: {img_path}")
+        if len(reference_images) > 1:
+            self.logger.debug("Aleph uses only the first reference image as promptImage")
+        
+        first = reference_images[0]
+        return [first if _is_remote(first) else self._encode_image(first)]
 
     def edit_video(
         self,
@@ -158,8 +293,10 @@ class RunwayAlephClient:
         
         Args:
             prompt: Text description of the desired edits/transformations
-            input_video: Path to input video file to edit
-            reference_images: Optional list of reference images for style guidance
+            input_video: Path to input video file to edit, or an HTTPS URL
+                that Runway fetches directly (skips the base64 upload)
+            reference_images: Optional list of reference images for style guidance,
+                as paths or HTTPS URLs
             width: Video width in pixels. Defaults to 1280.
             height: Video height in pixels. Defaults to 720.
             duration_seconds: Video duration. If None, uses input video duration.
@@ -177,25 +314,30 @@ class RunwayAlephClient:
         self.logger.info(f"Editing video with Aleph: {input_video}")
         self.logger.info(f"Edit prompt: {prompt}")
         
-        # Encode input video
-        video_data = self._encode_video(input_video)
+        # Check a local input video; it is encoded while the request is sent
+        video_file: Optional[Path] = None
+        video_mime_type: Optional[str] = None
+        video_url = input_video if _is_remote(input_video) else None
+        if video_url is None:
+            try:
+                video_file, video_mime_type = self._resolve_video(input_video)
+            except FileNotFoundError as e:
+                raise ValueError(f"Failed to encode video {input_video}: {e}")
         
         # Encode reference images if provided
-        reference_data: List[str] = []
-        if reference_images:
-            self.logger.info(f"Using {len(reference_images)} reference images")
-            for img_path in reference_images:
-                reference_data.append(self._encode_image(img_path))
+        reference_data = self._encode_reference_images(reference_images)
         
         # Create task
         task_data = self._create_edit_task(
             prompt=prompt,
-            video_data=video_data,
+            video_file=video_file,
+            video_mime_type=video_mime_type,
             reference_data=reference_data,
             width=width,
             height=height,
             duration_seconds=duration_seconds,
-            seed=seed
+            seed=seed,
+            video_url=video_url
         )
         
         # Poll for completion
@@ -242,11 +384,7 @@ class RunwayAlephClient:
         self.logger.info(f"Generation prompt: {prompt}")
         
         # Encode reference images if provided
-        reference_data: List[str] = []
-        if reference_images:
-            self.logger.info(f"Using {len(reference_images)} reference images")
-            for img_path in reference_images:
-                reference_data.append(self._encode_image(img_path))
+        reference_data = self._encode_reference_images(reference_images)
         
         # Create generation task
         task_data = self._create_generation_task(
@@ -271,61 +409,47 @@ class RunwayAlephClient:
     def _create_edit_task(
         self,
         prompt: str,
-        video_data: str,
-        reference_data: List[str],
+        video_file: Optional[Path],
+        video_mime_type: Optional[str],
+        reference_data: List[Union[str, bytearray]],
         width: int,
         height: int,
         duration_seconds: Optional[int],
-        seed: Optional[int]
+        seed: Optional[int],
+        video_url: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Create Aleph video editing task."""
+        """Create Aleph video editing task from a local video file or a video_url."""
         self.logger.info(f"Creating Aleph edit task: {width}x{height}")
         
         payload: Dict[str, Any] = {
             "model": "gen4_aleph",
             "promptText": prompt,
             "ratio": f"{width}:{height}",
-            "promptImage": video_data,  # Use video as promptImage for Aleph
         }
         
         if duration_seconds is not None:
             payload["duration"] = duration_seconds
             
-        if reference_data:
-            # For multiple reference images, use the first one as promptImage
-            # (Gen-4 style, though Aleph might support more)
-            payload["promptImage"] = reference_data[0]
-            
         if seed is not None:
             payload["seed"] = seed
 
-        if requests is None:
-            raise RuntimeError(REQUESTS_NOT_AVAILABLE_ERROR)
+        if reference_data:
+            # For multiple reference images, use the first one as promptImage
+            # (Gen-4 style, though Aleph might support more)
+            body: Any = _json_with_field(payload, "promptImage", reference_data[0])
+        elif video_url:
+            # Runway fetches remote videos itself
+            body = _json_with_field(payload, "promptImage", video_url)
+        else:
+            # Use video as promptImage for Aleph, encoded as it is uploaded
+            body = _DataUriJsonBody(payload, "promptImage", video_file, video_mime_type)
 
-        response = requests.post(
-            f"{self.base_url}/image_to_video",
-            headers=self._get_headers(),
-            json=payload,
-            timeout=60
-        )
-        
-        if response.status_code == 402:
-            raise InsufficientCreditsError("Insufficient credits for Aleph video editing")
-        
-        # Log the response for debugging
-        if response.status_code != 200:
-            error_details = response.text
-            self.logger.error(f"🚨 ALEPH API ERROR {response.status_code}: {error_details}")
-            # Also log to console for immediate visibility
-            print(f"🚨 ALEPH API ERROR {response.status_code}: {error_details}", file=sys.stderr)
-        
-        response.raise_for_status()
-        return response.json()
+        return self._post_task(body, "editing")
 
     def _create_generation_task(
         self,
         prompt: str,
-        reference_data: List[str],
+        reference_data: List[Union[str, bytearray]],
         width: int,
         height: int,
         duration_seconds: int,
@@ -341,43 +465,128 @@ class RunwayAlephClient:
             "duration": duration_seconds,
         }
         
-        if reference_data:
-            # For generation, use the first reference image as promptImage
-            payload["promptImage"] = reference_data[0]
-            
         if seed is not None:
             payload["seed"] = seed
 
-        if requests is None:
-            raise RuntimeError(REQUESTS_NOT_AVAILABLE_ERROR)
+        if reference_data:
+            # For generation, use the first reference image as promptImage
+            body = _json_with_field(payload, "promptImage", reference_data[0])
+        else:
+            body = dumps_json(payload)
 
-        response = requests.post(
-            f"{self.base_url}/image_to_video",
-            headers=self._get_headers(),
-            json=payload,
-            timeout=60
+        return self._post_task(body, "generation")
+
+    def _get_poll_delay(
+        self,
+        poll_count: int,
+        poll_interval: float,
+        server_hint: Optional[float] = None
+    ) -> float:
+        """
+        Get the wait before the next status check.
+
+        Doubles from poll_interval up to config.poll_max_interval, with jitter
+        so concurrent tasks don't poll in lockstep. A Retry-After value from
+        the server takes precedence.
+
+        Args:
+            poll_count: Number of status checks made so far
+            poll_interval: Delay before the first re-check
+            server_hint: Delay in seconds requested by the server, if any
+
+        Returns:
+            Delay in seconds
+        """
+        return calculate_retry_delay(
+            poll_count + 1,
+            poll_interval,
+            max(poll_interval, self.config.poll_max_interval),
+            self.config.retry_jitter_percent,
+            server_hint
         )
-        
+
+    def _post_task(self, body: Any, action: str) -> Dict[str, Any]:
+        """
+        Submit a task, retrying rate-limit and transient server errors.
+
+        The body is sent again on each attempt; a _DataUriJsonBody re-reads
+        the video file, so the encoded upload is never held in memory.
+
+        Args:
+            body: Serialized JSON body or _DataUriJsonBody
+            action: Description used in errors ("editing" or "generation")
+
+        Returns:
+            Task data from the response body
+
+        Raises:
+            InsufficientCreditsError: If the account is out of credits (402)
+            requests.exceptions.HTTPError: If the request still fails after
+                the last attempt, or fails with a non-retryable status
+        """
+        for attempt in range(1, _TASK_CREATE_MAX_ATTEMPTS + 1):
+            response = self.session.post(
+                f"{self.base_url}/image_to_video",
+                headers=self._get_headers(),
+                data=body,
+                timeout=60
+            )
+            if response.status_code not in _RETRYABLE_STATUSES or attempt == _TASK_CREATE_MAX_ATTEMPTS:
+                break
+
+            delay = calculate_retry_delay(
+                attempt,
+                self.config.retry_base_delay,
+                self.config.retry_max_delay,
+                self.config.retry_jitter_percent,
+                _retry_after(response)
+            )
+            self.logger.warning(
+                f"Aleph {action} request returned {response.status_code}, "
+                f"retrying in {delay:.0f}s (attempt {attempt}/{_TASK_CREATE_MAX_ATTEMPTS})"
+            )
+            time.sleep(delay)
+
+        return self._parse_task_response(response, action)
+
+    def _parse_task_response(self, response, action: str) -> Dict[str, Any]:
+        """
+        Return the task created by a task-creation request.
+
+        Args:
+            response: Response from the task-creation POST
+            action: Description used in errors ("editing" or "generation")
+
+        Returns:
+            Task data from the response body
+
+        Raises:
+            InsufficientCreditsError: If the account is out of credits (402)
+            requests.exceptions.HTTPError: For any other unsuccessful status
+        """
+        if response.ok:
+            return response.json()
+
         if response.status_code == 402:
-            raise InsufficientCreditsError("Insufficient credits for Aleph video generation")
-        
-        # Log the response for debugging
-        if response.status_code != 200:
-            error_details = response.text
-            self.logger.error(f"🚨 ALEPH API ERROR {response.status_code}: {error_details}")
-            # Also log to console for immediate visibility
-            print(f"🚨 ALEPH API ERROR {response.status_code}: {error_details}", file=sys.stderr)
-        
+            raise InsufficientCreditsError(f"Insufficient credits for Aleph video {action}")
+
+        # Error pages can be large HTML; log only the start of the body
+        error_details = response.content[:_ERROR_BODY_LOG_LIMIT].decode('utf-8', 'replace')
+        self.logger.error(f"🚨 ALEPH API ERROR {response.status_code}: {error_details}")
         response.raise_for_status()
         return response.json()
 
-    def poll_task(self, task_id: str, poll_interval: int = 5) -> Dict[str, Any]:
+    def poll_task(self, task_id: str, poll_interval: Optional[float] = None) -> Dict[str, Any]:
         """
         Poll a task until it completes.
 
+        The wait between checks starts at poll_interval and backs off
+        exponentially, so long edits cost a handful of requests.
+
         Args:
             task_id: The task ID to poll
-            poll_interval: Seconds between polling attempts
+            poll_interval: Seconds before the first re-check. Defaults to
+                config.poll_base_interval.
 
         Returns:
             Final task response with output
@@ -385,45 +594,75 @@ class RunwayAlephClient:
         Raises:
             RuntimeError: If task fails or polling fails
         """
+        if poll_interval is None:
+            poll_interval = self.config.poll_base_interval
         retry_count = 0
+        poll_count = 0
         
         while True:
             try:
                 response = self._get_task_status(task_id)
-                task_data = response.json()
+                task_data = self._read_task_status(task_id, response)
                 status = task_data.get("status")
 
                 if status == "SUCCEEDED":
+                    self._task_etags.pop(task_id, None)
                     self.logger.info(f"Aleph task {task_id} completed successfully")
                     return task_data
 
                 if status == "FAILED":
+                    self._task_etags.pop(task_id, None)
                     error_msg = task_data.get("failure", {}).get("reason", "Unknown error")
                     raise RuntimeError(f"Aleph task failed: {error_msg}")
 
                 # Task is still in progress
-                self.logger.info(f"Aleph task {task_id} status: {status}, waiting {poll_interval}s...")
-                time.sleep(poll_interval)
+                delay = self._get_poll_delay(poll_count, poll_interval, _retry_after(response))
+                poll_count += 1
+                self.logger.info(f"Aleph task {task_id} status: {status}, waiting {delay:.0f}s...")
+                time.sleep(delay)
 
             except Exception as e:
                 retry_count = self._handle_polling_error(e, retry_count, poll_interval, task_id)
 
     def _get_task_status(self, task_id: str):
-        """Get task status from API."""
-        if requests is None:
-            raise RuntimeError(REQUESTS_NOT_AVAILABLE_ERROR)
+        """Get task status from API, conditional on the last ETag seen."""
+        headers = self._get_headers()
+        cached = self._task_etags.get(task_id)
+        if cached is not None:
+            headers = {**headers, "If-None-Match": cached[0]}
         
-        return requests.get(
+        return self.session.get(
             f"{self.base_url}/tasks/{task_id}",
-            headers=self._get_headers(),
+            headers=headers,
             timeout=10
         )
 
-    def _handle_polling_error(self, e: Exception, retry_count: int, poll_interval: int, task_id: str) -> int:
+    def _read_task_status(self, task_id: str, response) -> Dict[str, Any]:
+        """
+        Get task data from a status response.
+
+        A 304 Not Modified reuses the data from the previous poll without a
+        body to parse.
+
+        Args:
+            task_id: The task ID that was polled
+            response: Response from _get_task_status
+
+        Returns:
+            Task data
+        """
+        cached = self._task_etags.get(task_id)
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+
+        task_data = loads_json(response.content)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._task_etags[task_id] = (etag, task_data)
+        return task_data
+
+    def _handle_polling_error(self, e: Exception, retry_count: int, poll_interval: float, task_id: str) -> int:
         """Handle polling errors and decide whether to retry."""
-        if requests is None:
-            raise RuntimeError(REQUESTS_NOT_AVAILABLE_ERROR)
-            
         if isinstance(e, requests.exceptions.SSLError):
             error_msg = str(e)
             if "CERTIFICATE_VERIFY_FAILED" in error_msg:
@@ -459,18 +698,12 @@ class RunwayAlephClient:
         self.logger.info(f"Downloading Aleph video to: {output_path}")
         
         try:
-            if requests is None:
-                raise RuntimeError(REQUESTS_NOT_AVAILABLE_ERROR)
-            
-            response = requests.get(url, timeout=300)  # 5 minute timeout
-            response.raise_for_status()
-            
             # Ensure output directory exists
             output_dir = Path(output_path).parent
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
+            # Fail fast on connect; allow slow reads (5 minutes) mid-download
+            download_to_file(url, output_path, timeout=(10, 300))
             
             self.logger.info(f"Aleph video downloaded successfully: {output_path}")
             return output_path
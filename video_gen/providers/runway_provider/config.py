@@ -1,8 +1,9 @@
 """RunwayML Gen-4 configuration."""
 
+import functools
 import os
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Dict, FrozenSet, Tuple, Union
 
 # Constants
 IMAGE_MIME_PREFIX = "image/"
@@ -11,10 +12,37 @@ ERROR_DIMENSIONS_INVALID = "Video dimensions must be positive"
 ERROR_FPS_INVALID = "FPS must be positive"
 ERROR_DURATION_INVALID = "Duration must be positive"
 
+# Example values from the docs that are not real API keys
+PLACEHOLDER_API_KEYS = frozenset({"your_runway_api_key_here", "your_api_key_here", "sk-..."})
 
-@dataclass
+# Clip lengths in seconds accepted by the Gen-4 models
+GEN4_DURATIONS = frozenset({5, 10})
+
+# Allowed durations per model: a set of lengths or an inclusive (min, max)
+# range in seconds, with the error raised when the default is outside it
+_GEN4_DURATIONS = (GEN4_DURATIONS, "Gen-4 models support duration of 5 or 10 seconds")
+_VEO_DURATIONS = ((2, 10), "Veo models support duration between 2-10 seconds")
+# Aleph supports variable duration for video editing tasks
+_ALEPH_DURATIONS = ((2, 30), "Aleph model supports duration between 2-30 seconds")
+
+MODEL_DURATION_RULES: Dict[str, Tuple[Union[FrozenSet[int], Tuple[int, int]], str]] = {
+    "gen4_turbo": _GEN4_DURATIONS,
+    "gen4": _GEN4_DURATIONS,
+    "gen4_aleph": _ALEPH_DURATIONS,
+    "veo3": _VEO_DURATIONS,
+    "veo3.1": _VEO_DURATIONS,
+    "veo3.1_fast": _VEO_DURATIONS,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class RunwayConfig:
-    """Configuration class for RunwayML video generation."""
+    """
+    Configuration class for RunwayML video generation.
+    
+    Instances are immutable and validated on construction, so clients can
+    derive and cache values (headers, shared sessions) from them safely.
+    """
     
     # API Configuration
     api_key: str
@@ -29,23 +57,35 @@ class RunwayConfig:
     default_model: str = "gen4_turbo"  # Options: gen4_turbo, gen4, veo3, veo3.1, veo3.1_fast
     
     # Supported models
-    SUPPORTED_MODELS = (
+    SUPPORTED_MODELS = frozenset({
         "gen4_turbo",      # RunwayML Gen-4 Turbo (fastest)
         "gen4",            # RunwayML Gen-4 (higher quality)
         "gen4_aleph",      # RunwayML Gen-4 Aleph (video editing and transformation)
         "veo3",            # Google Veo 3.0 via RunwayML (40 credits/sec)
         "veo3.1",          # Google Veo 3.1 via RunwayML (40 credits/sec)
         "veo3.1_fast",     # Google Veo 3.1 Fast via RunwayML (20 credits/sec)
-    )
+    })
     
     # Retry configuration
     retry_base_delay: int = 30      # Initial retry delay in seconds
     retry_max_delay: int = 300      # Maximum retry delay in seconds
     retry_jitter_percent: float = 0.2  # Jitter percentage (±20%)
     
+    # Send reference images as raw files through the uploads endpoint and
+    # reference them by URI, instead of inlining them as base64 data URIs
+    upload_images: bool = False
+    
+    # Polling configuration
+    poll_base_interval: float = 2.0   # First status-check delay in seconds, doubled each poll
+    poll_max_interval: float = 15.0   # Maximum delay between status checks
+    
     # Supported file types
     supported_image_mime_prefixes: Tuple[str, ...] = (IMAGE_MIME_PREFIX,)
     
+    def __post_init__(self) -> None:
+        """Reject invalid settings when the configuration is created."""
+        self.validate()
+    
     @classmethod
     def from_environment(cls) -> "RunwayConfig":
         """
@@ -68,8 +108,25 @@ class RunwayConfig:
         
         base_url = os.getenv("RUNWAY_BASE_URL", "https://api.dev.runwayml.com/v1")
         model = os.getenv("RUNWAY_MODEL", "gen4_turbo")
+        upload_images = os.getenv("RUNWAY_UPLOAD_IMAGES", "").strip().lower() in ("1", "true", "yes")
+        
+        return cls._from_values(api_key, base_url, model, upload_images)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _from_values(
+        cls, api_key: str, base_url: str, default_model: str, upload_images: bool = False
+    ) -> "RunwayConfig":
+        """
+        Build (and validate) a configuration once per distinct set of values.
         
-        return cls(api_key=api_key, base_url=base_url, default_model=model)
+        Instances are frozen, so repeated from_environment() calls share one
+        object until the environment changes, and clients cached by
+        configuration are found without re-validating.
+        """
+        return cls(
+            api_key=api_key, base_url=base_url, default_model=default_model, upload_images=upload_images
+        )
     
     def validate(self) -> None:
         """
@@ -90,19 +147,16 @@ class RunwayConfig:
         if self.default_fps <= 0:
             raise ValueError(ERROR_FPS_INVALID)
         
-        # Validate duration based on model
-        is_veo = self.default_model.startswith("veo")
-        is_aleph = self.default_model == "gen4_aleph"
+        # Validate duration based on model; unlisted Veo variants follow the
+        # Veo rule and any other model the Gen-4 rule
+        rule = MODEL_DURATION_RULES.get(self.default_model)
+        if rule is None:
+            rule = _VEO_DURATIONS if self.default_model.startswith("veo") else _GEN4_DURATIONS
+        allowed, message = rule
         
-        if is_veo:
-            # Veo models support 2-10 seconds
-            if not (2 <= self.default_duration <= 10):
-                raise ValueError("Veo models support duration between 2-10 seconds")
-        elif is_aleph:
-            # Aleph supports variable duration for video editing tasks
-            if not (2 <= self.default_duration <= 30):
-                raise ValueError("Aleph model supports duration between 2-30 seconds")
+        if isinstance(allowed, tuple):
+            valid = allowed[0] <= self.default_duration <= allowed[1]
         else:
-            # Gen-4 models support 5 or 10 seconds
-            if self.default_duration not in [5, 10]:
-                raise ValueError("Gen-4 models support duration of 5 or 10 seconds")
+            valid = self.default_duration in allowed
+        if not valid:
+            raise ValueError(message)
@@ -0,0 +1,355 @@
+"""Data URI encoding shared by the RunwayML clients.
+
+Runway receives images and videos inline as base64 data URIs. Inputs are
+encoded chunk by chunk straight into a buffer sized for the whole URI, so
+encoding a file never holds the raw bytes, the encoded bytes and the final
+string in memory at the same time. Oversized images are recompressed as
+JPEG first, see compress_jpeg.
+"""
+
+import contextlib
+import functools
+import io
+import mimetypes
+import mmap
+import os
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Tuple, Union
+
+try:
+    # SIMD-accelerated drop-in replacement for the standard library module
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    # Recodes JPEG entropy data the way mozjpeg does, losslessly
+    import mozjpeg_lossless_optimization
+except ImportError:
+    mozjpeg_lossless_optimization = None
+
+# Bytes encoded per step; a multiple of 3 so no chunk is padded
+_ENCODE_CHUNK_SIZE = 3 * 64 * 1024
+
+# JPEG quality range searched when compressing oversized images
+_JPEG_MAX_QUALITY = 85
+_JPEG_MIN_QUALITY = 45
+
+# Pillow's JPEG chroma subsampling setting: 0 is 4:4:4, 1 is 4:2:2 and 2 is
+# 4:2:0. Video is 4:2:0 throughout, so finer chroma would be wasted bytes
+_JPEG_SUBSAMPLING = 2
+
+# Largest frame Runway renders (landscape); images well beyond it in either
+# orientation are shrunk before compressing, as Runway would rescale them
+_MAX_FRAME_SIZE = (1920, 1080)
+_DOWNSCALE_MARGIN = 1.5
+
+
+def data_uri_prefix(mime_type: str) -> bytes:
+    """Return the ``data:<mime>;base64,`` header for a data URI."""
+    return f"data:{mime_type};base64,".encode('ascii')
+
+
+def base64_length(size: int) -> int:
+    """Return the length of the base64 encoding of ``size`` bytes."""
+    return 4 * ((size + 2) // 3)
+
+
+def guess_image_mime_type(path: Union[str, Path]) -> str:
+    """Guess an image's MIME type from its name, defaulting to JPEG."""
+    return _image_mime_type_for_suffix(Path(path).suffix)
+
+
+@functools.lru_cache(maxsize=64)
+def _image_mime_type_for_suffix(suffix: str) -> str:
+    """Look up the image MIME type for a file suffix once per suffix."""
+    mime_type, _ = mimetypes.guess_type(f"image{suffix}")
+    if not mime_type or not mime_type.startswith('image/'):
+        return 'image/jpeg'
+    return mime_type
+
+
+def _iter_encoded(view: memoryview) -> Iterator[bytes]:
+    """Base64-encode a buffer in chunks, unpadded except for the last."""
+    for start in range(0, len(view), _ENCODE_CHUNK_SIZE):
+        yield base64.b64encode(view[start:start + _ENCODE_CHUNK_SIZE])
+
+
+def _encode_view(view: memoryview, mime_type: str) -> bytearray:
+    """Encode a buffer into a data URI buffer allocated once up front."""
+    prefix = data_uri_prefix(mime_type)
+    buf = bytearray(len(prefix) + base64_length(len(view)))
+    buf[:len(prefix)] = prefix
+    pos = len(prefix)
+    for encoded in _iter_encoded(view):
+        buf[pos:pos + len(encoded)] = encoded
+        pos += len(encoded)
+    return buf
+
+
+@contextlib.contextmanager
+def _map_file(f: BinaryIO, size: int) -> Iterator[memoryview]:
+    """
+    Memory-map the first ``size`` bytes of a file for one front-to-back read.
+
+    The kernel is told the access is sequential (where madvise is available)
+    so it reads ahead aggressively and can drop pages once they are passed.
+    """
+    with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mapped) as view:
+            yield view
+
+
+def base64_chunks(f: BinaryIO, size: int) -> Iterator[bytes]:
+    """
+    Base64-encode the first ``size`` bytes of an open file chunk by chunk.
+
+    The file is memory-mapped and encoded straight from the mapping, so no
+    intermediate bytes copy of each chunk is made.
+
+    Args:
+        f: File opened in binary mode
+        size: Number of bytes to encode, normally the file size
+
+    Yields:
+        Encoded chunks, unpadded except for the last
+    """
+    if size == 0:
+        # Empty files cannot be mapped
+        return
+    with _map_file(f, size) as view:
+        yield from _iter_encoded(view)
+
+
+def encode_file_data_uri(path: Union[str, Path], mime_type: str) -> bytearray:
+    """
+    Encode a file as a base64 data URI without holding a raw copy in memory.
+
+    The URI is returned as ASCII bytes; callers that need a str decode it
+    once with ``.decode('ascii')``.
+
+    Args:
+        path: File to encode
+        mime_type: MIME type for the data URI
+
+    Returns:
+        Data URI as ASCII bytes
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return bytearray(data_uri_prefix(mime_type))
+        with _map_file(f, size) as view:
+            return _encode_view(view, mime_type)
+
+
+def encode_buffer_data_uri(buffer: io.BytesIO, mime_type: str) -> bytearray:
+    """
+    Encode the contents of an in-memory buffer as a base64 data URI.
+
+    Reads through ``getbuffer()`` rather than ``getvalue()``, so the buffer's
+    contents are not copied before encoding.
+
+    Args:
+        buffer: Buffer holding the encoded image
+        mime_type: MIME type for the data URI
+
+    Returns:
+        Data URI as ASCII bytes
+    """
+    with buffer.getbuffer() as view:
+        return _encode_view(view, mime_type)
+
+
+def shrink_to_box(img, box: Tuple[int, int], pil_image) -> None:
+    """
+    Shrink an image in place to fit within ``box``, keeping its aspect ratio.
+
+    The image is first box-reduced by the largest whole factor that keeps it
+    at least box-sized (``reducing_gap=1.0``), then bilinear-resampled for
+    the remainder. For a JPEG that has not been loaded yet, Pillow makes
+    that reduction in the decoder itself (``draft``, at 1/2, 1/4 or 1/8
+    scale), so the full-size pixels are never decoded.
+
+    The result is JPEG-compressed straight away, so a sharper but several
+    times slower filter such as LANCZOS would make no visible difference.
+
+    Args:
+        img: PIL image, modified in place
+        box: Maximum (width, height)
+        pil_image: The PIL Image module
+    """
+    img.thumbnail(box, pil_image.Resampling.BILINEAR, reducing_gap=1.0)
+
+
+def _frame_box(img) -> Tuple[int, int]:
+    """Return the largest output frame in the image's orientation."""
+    long_side, short_side = _MAX_FRAME_SIZE
+    return (long_side, short_side) if img.width >= img.height else (short_side, long_side)
+
+
+def exceeds_frame(img) -> bool:
+    """
+    Check whether downscale_to_frame would shrink an image.
+
+    Only the header is needed, so this is cheap to call before the image's
+    pixels are loaded.
+    """
+    box = _frame_box(img)
+    return img.width > box[0] * _DOWNSCALE_MARGIN or img.height > box[1] * _DOWNSCALE_MARGIN
+
+
+def downscale_to_frame(img, pil_image) -> bool:
+    """
+    Shrink an image far larger than any Runway output frame, in place.
+
+    JPEG encode time grows with pixel count, so bringing e.g. a 4K or phone
+    camera image down to frame size first makes every compression probe
+    cheaper. Images within 1.5x of the frame are left alone. Called on a
+    JPEG before anything loads it, the image is decoded at reduced scale,
+    see shrink_to_box.
+
+    Args:
+        img: PIL image, modified in place
+        pil_image: The PIL Image module
+
+    Returns:
+        True if the image was resized
+    """
+    if not exceeds_frame(img):
+        return False
+    shrink_to_box(img, _frame_box(img), pil_image)
+    return True
+
+
+def save_jpeg(img, quality: int, buffer: Optional[io.BytesIO] = None) -> io.BytesIO:
+    """
+    Save a PIL image as an optimized JPEG.
+
+    Progressive encoding is used: it typically comes out a few percent
+    smaller than baseline at the same quality, which lets compress_jpeg
+    settle on a higher quality under the same limit. Chroma is always
+    subsampled 4:2:0, and the result is further optimized with mozjpeg
+    when mozjpeg-lossless-optimization is installed.
+
+    Args:
+        img: RGB PIL image
+        quality: JPEG quality
+        buffer: Buffer to overwrite, reusing its allocation. A new buffer is
+            created if None.
+
+    Returns:
+        Buffer positioned at the end of the encoded image
+    """
+    if buffer is None:
+        buffer = io.BytesIO()
+    else:
+        # Overwrite in place and cut off the stale tail afterwards;
+        # truncating first would shrink the allocation being reused
+        buffer.seek(0)
+    img.save(
+        buffer,
+        format='JPEG',
+        quality=quality,
+        optimize=True,
+        progressive=True,
+        subsampling=_JPEG_SUBSAMPLING,
+    )
+    buffer.truncate()
+    _optimize_jpeg(buffer)
+    return buffer
+
+
+def _optimize_jpeg(buffer: io.BytesIO) -> None:
+    """
+    Losslessly shrink an encoded JPEG in place with mozjpeg, if installed.
+
+    mozjpeg picks progressive scan layouts and Huffman tables better than
+    libjpeg's ``optimize``, typically saving several percent more without
+    changing a single pixel.
+
+    Args:
+        buffer: Buffer holding the encoded image, left positioned at its end
+    """
+    if mozjpeg_lossless_optimization is None:
+        return
+    optimized = mozjpeg_lossless_optimization.optimize(buffer.getvalue())
+    buffer.seek(0)
+    buffer.write(optimized)
+    buffer.truncate()
+
+
+def repack_jpeg(img) -> io.BytesIO:
+    """
+    Re-save a JPEG without requantizing it.
+
+    ``quality='keep'`` reuses the source's quantization tables and chroma
+    subsampling, so image quality is unchanged. Only metadata is dropped
+    (EXIF, embedded thumbnails) and the entropy coding optimized. The ICC
+    profile is kept so colors render the same.
+
+    Args:
+        img: PIL image opened from a JPEG file, before any conversion
+
+    Returns:
+        Buffer positioned at the end of the encoded image
+    """
+    buffer = io.BytesIO()
+    img.save(
+        buffer,
+        format='JPEG',
+        quality='keep',
+        optimize=True,
+        progressive=True,
+        icc_profile=img.info.get('icc_profile'),
+    )
+    _optimize_jpeg(buffer)
+    return buffer
+
+
+def compress_jpeg(img, max_size_kb: float) -> Optional[Tuple[io.BytesIO, int]]:
+    """
+    Find a JPEG quality that brings an image under a size limit.
+
+    JPEG size grows roughly linearly with quality over the searched range,
+    so rather than stepping down one quality level at a time the image is
+    probed at the top and bottom of the range and a third encode is made
+    at the quality the two sizes predict. That is at most three encodes
+    instead of one per level.
+
+    Args:
+        img: RGB PIL image
+        max_size_kb: Size limit in KB
+
+    Returns:
+        (buffer, quality) for the best quality found under the limit, or
+        None if even the lowest quality is too large
+    """
+    limit = max_size_kb * 1024
+
+    high = save_jpeg(img, _JPEG_MAX_QUALITY)
+    high_size = high.tell()
+    if high_size <= limit:
+        return high, _JPEG_MAX_QUALITY
+
+    low = save_jpeg(img, _JPEG_MIN_QUALITY)
+    low_size = low.tell()
+    if low_size > limit:
+        return None
+
+    # Interpolate between the probes, rounding down to stay under the limit
+    quality = _JPEG_MIN_QUALITY + int(
+        (limit - low_size) * (_JPEG_MAX_QUALITY - _JPEG_MIN_QUALITY) / (high_size - low_size)
+    )
+    quality = min(quality, _JPEG_MAX_QUALITY - 1)
+    if quality > _JPEG_MIN_QUALITY:
+        # The oversized first probe is no longer needed; reuse its buffer
+        predicted = save_jpeg(img, quality, high)
+        if predicted.tell() <= limit:
+            return predicted, quality
+    return low, _JPEG_MIN_QUALITY
@@ -4,10 +4,10 @@ RunwayML Gen-4 API client with retry logic for video generation.
 Handles API calls for RunwayML's native Gen-4 and Gen-4 Turbo models.
 """
 
+import re
 import time
 import random
-import base64
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
 try:
@@ -15,10 +15,38 @@ try:
 except ImportError:
     requests = None
 
-from .config import RunwayConfig
+try:
+    # Optional: only needed to compress images over the inline size limit
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from .config import RunwayConfig, PLACEHOLDER_API_KEYS
+from .session import download_to_file, dumps_json, get_session, loads_json, upload_ephemeral
+from .encoding import (
+    compress_jpeg,
+    downscale_to_frame,
+    encode_buffer_data_uri,
+    encode_file_data_uri,
+    exceeds_frame,
+    guess_image_mime_type,
+    repack_jpeg,
+    save_jpeg,
+    shrink_to_box,
+)
+from .image_cache import cache_encoded_image
 from ...exceptions import InsufficientCreditsError
 from ...logger import get_library_logger
-from ...retry_utils import handle_capacity_retry
+from ...artifact_manager import get_artifact_manager
+from ...retry_utils import calculate_retry_delay, handle_capacity_retry
+
+# Phrases in a 400 response that mean the account is out of credits
+_INSUFFICIENT_CREDITS_RE = re.compile(
+    r"insufficient credits|not enough credit|do not have enough credits", re.IGNORECASE
+)
+
+# Task states after which polling stops
+_FINISHED_STATUSES = frozenset({"SUCCEEDED", "FAILED", "CANCELLED"})
 
 
 class RunwayGen4Client:
@@ -48,7 +76,7 @@ class RunwayGen4Client:
             )
         
         # Check for placeholder values
-        if self.api_key in ("your_runway_api_key_here", "your_api_key_here", "sk-..."):
+        if self.api_key in PLACEHOLDER_API_KEYS:
             raise ValueError(
                 f"RUNWAY_API_KEY appears to be a placeholder: '{self.api_key}'\n"
                 "Replace it with your actual API key from:\n"
@@ -60,22 +88,29 @@ class RunwayGen4Client:
         self.base_delay = config.retry_base_delay
         self.max_delay = config.retry_max_delay
 
+        # Pooled keep-alive connections shared with the other Runway clients
+        self.session = get_session()
+        # Request headers are fixed for the client's lifetime; build them once
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "X-Runway-Version": "2024-11-06"
+        }
+        # Last ETag and task data per unfinished task, for conditional polls
+        self._task_etags: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
         self.logger.debug("RunwayGen4Client initialized")
 
     def _is_insufficient_credits(self, response_text: str, error_message: Any) -> bool:
-        """Return True if response indicates insufficient credits."""
-        parts = []
-        if error_message is not None:
-            parts.append(str(error_message))
-        if response_text:
-            parts.append(response_text)
-        combined = " ".join(parts).lower()
-        return (
-            "insufficient credits" in combined
-            or "not enough credit" in combined
-            or "not enough credits" in combined
-            or "do not have enough credits" in combined
-        )
+        """
+        Return True if response indicates insufficient credits.
+
+        The parsed error message is checked first; the raw body is only
+        searched when the message doesn't match.
+        """
+        if error_message is not None and _INSUFFICIENT_CREDITS_RE.search(str(error_message)):
+            return True
+        return bool(response_text) and _INSUFFICIENT_CREDITS_RE.search(response_text) is not None
 
     def _get_headers(self) -> Dict[str, str]:
         """
@@ -84,13 +119,36 @@ class RunwayGen4Client:
         Returns:
             Dictionary of HTTP headers
         """
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "X-Runway-Version": "2024-11-06"
-        }
+        return self._headers
 
-    def _encode_image_to_base64(self, image_path: str, max_size_kb: int = 800) -> str:
+    def _prepare_image(self, image_path: str) -> str:
+        """
+        Get the value sent in a task request for a local image.
+
+        With upload_images enabled the raw file is uploaded and referenced by
+        its Runway URI; otherwise, or if the upload fails, it is sent inline
+        as a base64 data URI.
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            Runway URI or data URI for the image
+        """
+        if self.config.upload_images:
+            path = Path(image_path)
+            if not path.exists():
+                raise FileNotFoundError(f"Image file not found: {image_path}")
+            try:
+                return upload_ephemeral(self.config.base_url, self._headers, path, guess_image_mime_type(path))
+            except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+                self.logger.warning("Upload of %s failed, sending it inline: %s", path.name, e)
+        return self._encode_image_to_base64(image_path)
+
+    @cache_encoded_image
+    def _encode_image_to_base64(
+        self, image_path: str, max_size_kb: int = 800, file_size: Optional[int] = None
+    ) -> str:
         """
         Encode an image file to base64 data URI with automatic compression.
         
@@ -100,59 +158,61 @@ class RunwayGen4Client:
         Args:
             image_path: Path to the image file
             max_size_kb: Maximum size in KB before compression (default: 800KB)
+            file_size: Size of the file in bytes if already known, as passed
+                by the image cache; the file is stat'ed otherwise
 
         Returns:
-            Base64 encoded data URI string
+            Base64 encoded data URI string, reused from the image cache while
+            the file is unchanged
         """
-        try:
-            from PIL import Image as pil_image_module
-        except ImportError:
-            pil_image_module = None
-
         path = Path(image_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Image file not found: {image_path}")
-
-        original_size_kb = path.stat().st_size / 1024
+        if file_size is None:
+            # One stat both checks the file exists and sizes it
+            try:
+                file_size = path.stat().st_size
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Image file not found: {image_path}") from None
+        original_size_kb = file_size / 1024
         
         # Use original if small enough or no PIL available
-        if original_size_kb <= max_size_kb or pil_image_module is None:
-            return self._encode_original_image(path, original_size_kb, max_size_kb, pil_image_module)
+        if original_size_kb <= max_size_kb or Image is None:
+            return self._encode_original_image(path, original_size_kb, max_size_kb, Image)
         
         # Compress using PIL
-        return self._compress_and_encode_image(path, original_size_kb, max_size_kb, pil_image_module)
+        return self._compress_and_encode_image(path, original_size_kb, max_size_kb, Image)
     
     def _encode_original_image(self, path, original_size_kb: float, max_size_kb: int, pil_image):
         """Encode original image without compression."""
-        import mimetypes
-        
         if original_size_kb > max_size_kb and pil_image is None:
             self.logger.warning(
                 f"Image {path.name} is {original_size_kb:.0f}KB (>{max_size_kb}KB) "
                 "but PIL not available for compression. Install: pip install pillow"
             )
         
-        mime_type, _ = mimetypes.guess_type(str(path))
-        if not mime_type or not mime_type.startswith('image/'):
-            mime_type = 'image/jpeg'
-        
-        with open(path, 'rb') as f:
-            image_data = f.read()
-        
-        encoded = base64.b64encode(image_data).decode('utf-8')
-        return f"data:{mime_type};base64,{encoded}"
+        # Decoded once here; the ASCII codec is the cheapest for base64 text
+        return encode_file_data_uri(path, guess_image_mime_type(path)).decode('ascii')
     
     def _compress_and_encode_image(self, path, original_size_kb: float, max_size_kb: int, pil_image):
         """Compress and encode image using PIL."""
-        from io import BytesIO
-        
         self.logger.debug(
             f"Compressing {path.name} ({original_size_kb:.0f}KB) to under {max_size_kb}KB"
         )
         
         img = pil_image.open(path)
+        
+        # Stripping metadata is often enough for JPEGs and loses no quality.
+        # Not tried for JPEGs that get downscaled anyway: repacking decodes
+        # them at full size, where left unloaded they decode at reduced scale
+        if img.format == 'JPEG' and not exceeds_frame(img):
+            result = self._try_lossless_repack(img, path, original_size_kb, max_size_kb)
+            if result:
+                return result
+        
         img = self._convert_to_rgb(img, pil_image)
         
+        if downscale_to_frame(img, pil_image):
+            self.logger.debug("Downscaled %s to %dx%d before compressing", path.name, img.width, img.height)
+        
         # Try quality compression first
         result = self._try_quality_compression(img, path, original_size_kb, max_size_kb)
         if result:
@@ -161,52 +221,59 @@ class RunwayGen4Client:
         # Fallback to resizing
         return self._resize_and_compress(img, path, original_size_kb)
     
+    def _try_lossless_repack(self, img, path, original_size_kb: float, max_size_kb: int) -> Optional[str]:
+        """Re-save a JPEG at its original quality without metadata."""
+        buffer = repack_jpeg(img)
+        repacked_size_kb = buffer.tell() / 1024
+        if repacked_size_kb > max_size_kb:
+            return None
+        
+        self.logger.info(
+            f"Repacked {path.name}: {original_size_kb:.0f}KB → {repacked_size_kb:.0f}KB (original quality)"
+        )
+        return encode_buffer_data_uri(buffer, 'image/jpeg').decode('ascii')
+    
     def _convert_to_rgb(self, img, pil_image):
         """Convert RGBA/LA/P images to RGB."""
         if img.mode in ('RGBA', 'LA', 'P'):
-            background = pil_image.new('RGB', img.size, (255, 255, 255))
             if img.mode == 'P':
                 img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+            alpha = img.getchannel('A')
+            # Fully opaque: drop the alpha channel instead of compositing
+            if alpha.getextrema() == (255, 255):
+                return img.convert('RGB')
+            background = pil_image.new('RGB', img.size, (255, 255, 255))
+            background.paste(img, mask=alpha)
             return background
         return img
     
     def _try_quality_compression(self, img, path, original_size_kb: float, max_size_kb: int):
         """Try progressive quality compression."""
-        from io import BytesIO
+        result = compress_jpeg(img, max_size_kb)
+        if result is None:
+            return None
         
-        for quality in [85, 75, 65, 55, 45]:
-            buffer = BytesIO()
-            img.save(buffer, format='JPEG', quality=quality, optimize=True)
-            compressed_size_kb = len(buffer.getvalue()) / 1024
-            
-            if compressed_size_kb <= max_size_kb:
-                self.logger.info(
-                    f"Compressed {path.name}: {original_size_kb:.0f}KB → {compressed_size_kb:.0f}KB "
-                    f"(quality={quality})"
-                )
-                encoded = base64.b64encode(buffer.getvalue()).decode('utf-8')
-                return f"data:image/jpeg;base64,{encoded}"
-        return None
+        buffer, quality = result
+        compressed_size_kb = buffer.tell() / 1024
+        self.logger.info(
+            f"Compressed {path.name}: {original_size_kb:.0f}KB → {compressed_size_kb:.0f}KB "
+            f"(quality={quality})"
+        )
+        return encode_buffer_data_uri(buffer, 'image/jpeg').decode('ascii')
     
     def _resize_and_compress(self, img, path, original_size_kb: float):
         """Resize image as last resort."""
-        from io import BytesIO
-        from PIL import Image
-        
         self.logger.warning(f"Resizing {path.name} to reduce size further")
-        img.thumbnail((1920, 1080), Image.Resampling.LANCZOS)
+        shrink_to_box(img, (1920, 1080), Image)
         
-        buffer = BytesIO()
-        img.save(buffer, format='JPEG', quality=85, optimize=True)
-        final_size_kb = len(buffer.getvalue()) / 1024
+        buffer = save_jpeg(img, 85)
+        final_size_kb = buffer.tell() / 1024
         
         self.logger.info(
             f"Resized and compressed {path.name}: {original_size_kb:.0f}KB → {final_size_kb:.0f}KB"
         )
         
-        encoded = base64.b64encode(buffer.getvalue()).decode('utf-8')
-        return f"data:image/jpeg;base64,{encoded}"
+        return encode_buffer_data_uri(buffer, 'image/jpeg').decode('ascii')
 
     def create_image_to_video_task(
         self,
@@ -254,7 +321,7 @@ class RunwayGen4Client:
         self.logger.debug(f"Encoding source image: {image_path}")
         prompt_image = None
         if image_path is not None:
-            prompt_image = self._encode_image_to_base64(image_path)
+            prompt_image = self._prepare_image(image_path)
 
         # Build request payload
         payload: Dict[str, Any] = {
@@ -278,10 +345,12 @@ class RunwayGen4Client:
 
     def _make_request_with_retry(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Make API request with exponential backoff retry logic."""
+        # Serialized once; retries resend the same body
+        body = dumps_json(payload)
         retry_count = 0
         while True:
             try:
-                response = self._send_request(payload, retry_count)
+                response = self._send_request(body, retry_count)
                 return self._handle_response(response)
             except requests.exceptions.SSLError as e:
                 self._handle_ssl_error(e)
@@ -293,13 +362,13 @@ class RunwayGen4Client:
                 self.logger.error(f"RunwayML API error: {e}")
                 raise RuntimeError(f"RunwayML API request failed: {e}")
     
-    def _send_request(self, payload: Dict[str, Any], retry_count: int):
-        """Send API request with logging."""
+    def _send_request(self, body: bytes, retry_count: int):
+        """Send the serialized API request with logging."""
         self.logger.debug(f"Sending RunwayML API request (attempt {retry_count + 1})")
-        return requests.post(
+        return self.session.post(
             f"{self.base_url}/image_to_video",
             headers=self._get_headers(),
-            json=payload,
+            data=body,
             timeout=30
         )
     
@@ -428,7 +497,7 @@ class RunwayGen4Client:
             RuntimeError: If response is invalid
         """
         try:
-            task_data = response.json()
+            task_data = loads_json(response.content)
         except ValueError as e:
             self.logger.error(f"Failed to parse JSON response: {response.text}")
             raise RuntimeError(f"Invalid JSON response from RunwayML: {e}")
@@ -524,13 +593,132 @@ class RunwayGen4Client:
         self.logger.error(f"Unknown exception during polling: {e}")
         return False
 
-    def poll_task(self, task_id: str, poll_interval: int = 5) -> Dict[str, Any]:
+    def _get_task(self, task_id: str) -> Dict[str, Any]:
+        """
+        Fetch the current state of a task.
+
+        Polls are conditional on the ETag of the previous response, so a
+        task that has not changed comes back as an empty 304 and the last
+        parsed data is reused.
+
+        Args:
+            task_id: The task ID to look up
+
+        Returns:
+            Parsed task data
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+            RuntimeError: If the response is invalid
+        """
+        headers = self._get_headers()
+        cached = self._task_etags.get(task_id)
+        if cached is not None:
+            headers = {**headers, "If-None-Match": cached[0]}
+
+        response = self.session.get(
+            f"{self.base_url}/tasks/{task_id}",
+            headers=headers,
+            timeout=10
+        )
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+        response.raise_for_status()
+        task_data = self._parse_polling_response(response)
+
+        etag = response.headers.get("ETag")
+        if etag and task_data.get("status") not in _FINISHED_STATUSES:
+            self._task_etags[task_id] = (etag, task_data)
+        else:
+            self._task_etags.pop(task_id, None)
+        return task_data
+
+    def poll_tasks(self, task_ids: List[str], poll_interval: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Poll several tasks until they all finish.
+
+        Each tick checks every pending task once and then sleeps once, instead
+        of running one poll loop per task. Unlike poll_task, failed tasks are
+        returned rather than raised so one failure does not discard the rest;
+        callers should check each task's ``status``.
+
+        Args:
+            task_ids: The task IDs to poll
+            poll_interval: Seconds before the second round, backing off from
+                there. Defaults to config.poll_base_interval.
+
+        Returns:
+            Final task data, in the order of ``task_ids``
+
+        Raises:
+            RuntimeError: If polling fails with a non-retryable error
+        """
+        if poll_interval is None:
+            poll_interval = self.config.poll_base_interval
+        finished: Dict[str, Dict[str, Any]] = {}
+        pending = list(dict.fromkeys(task_ids))
+        poll_count = 0
+
+        while True:
+            for task_id in list(pending):
+                try:
+                    task_data = self._get_task(task_id)
+                except Exception as e:
+                    # The round's single sleep below stands in for the per-error wait
+                    if not self._handle_polling_exceptions(e, 0):
+                        raise
+                    continue
+
+                if task_data.get("status") in _FINISHED_STATUSES:
+                    self.logger.info(f"RunwayML task {task_id} finished: {task_data.get('status')}")
+                    finished[task_id] = task_data
+                    pending.remove(task_id)
+
+            if not pending:
+                return [finished[task_id] for task_id in task_ids]
+
+            time.sleep(self._get_poll_delay(poll_count, poll_interval))
+            poll_count += 1
+
+    def _get_poll_delay(self, poll_count: int, poll_interval: float) -> float:
+        """
+        Get the wait before the next status check.
+
+        Doubles from poll_interval up to config.poll_max_interval, with jitter
+        so concurrent tasks don't poll in lockstep.
+
+        Args:
+            poll_count: Number of status checks made so far
+            poll_interval: Delay before the first check
+
+        Returns:
+            Delay in seconds
+        """
+        return calculate_retry_delay(
+            poll_count + 1,
+            poll_interval,
+            max(poll_interval, self.config.poll_max_interval),
+            self.config.retry_jitter_percent
+        )
+
+    def poll_task(
+        self,
+        task_id: str,
+        poll_interval: Optional[float] = None,
+        initial_delay: float = 0
+    ) -> Dict[str, Any]:
         """
         Poll a task until it completes.
 
+        The wait between checks starts at poll_interval and backs off
+        exponentially, so long generations cost a handful of requests.
+
         Args:
             task_id: The task ID to poll
-            poll_interval: Seconds between polling attempts
+            poll_interval: Seconds before the first re-check. Defaults to
+                config.poll_base_interval.
+            initial_delay: Seconds to wait before the first check, for tasks
+                that cannot finish sooner
 
         Returns:
             Final task response with output
@@ -538,16 +726,17 @@ class RunwayGen4Client:
         Raises:
             RuntimeError: If task fails or polling fails
         """
+        if poll_interval is None:
+            poll_interval = self.config.poll_base_interval
+        if initial_delay > 0:
+            time.sleep(initial_delay)
+
+        poll_count = 0
         while True:
+            delay = self._get_poll_delay(poll_count, poll_interval)
+            poll_count += 1
             try:
-                response = requests.get(
-                    f"{self.base_url}/tasks/{task_id}",
-                    headers=self._get_headers(),
-                    timeout=10
-                )
-                response.raise_for_status()
-                
-                task_data = self._parse_polling_response(response)
+                task_data = self._get_task(task_id)
                 status = self._handle_task_status(task_data)
                 
                 # If task succeeded, return the data
@@ -555,10 +744,10 @@ class RunwayGen4Client:
                     return task_data
                 
                 # Otherwise keep polling
-                time.sleep(poll_interval)
+                time.sleep(delay)
 
             except Exception as e:
-                should_continue = self._handle_polling_exceptions(e, poll_interval)
+                should_continue = self._handle_polling_exceptions(e, delay)
                 if not should_continue:
                     raise
 
@@ -577,13 +766,7 @@ class RunwayGen4Client:
             RuntimeError: If download fails including SSL errors
         """
         try:
-            response = requests.get(url, stream=True, timeout=60)
-            response.raise_for_status()
-
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-
+            download_to_file(url, output_path, timeout=60)
             return output_path
 
         except requests.exceptions.SSLError as e:
@@ -647,7 +830,6 @@ class RunwayGen4Client:
             raise RuntimeError("No task ID in response")
 
         # Track artifact for later download
-        from ...artifact_manager import get_artifact_manager
         artifact_manager = get_artifact_manager()
         artifact_manager.add_artifact(
             task_id=task_id,
@@ -662,8 +844,8 @@ class RunwayGen4Client:
             }
         )
 
-        # Poll until complete
-        completed_task = self.poll_task(task_id)
+        # Poll until complete; a clip takes at least its own length to render
+        completed_task = self.poll_task(task_id, initial_delay=duration)
 
         # Get output URL and update artifact
         output_urls = completed_task.get("output", [])
@@ -0,0 +1,67 @@
+"""Cache of encoded reference images shared by the RunwayML clients.
+
+Runway receives images inline as base64 data URIs. Stitching workflows send
+the same first frame or style reference with many tasks, so the encoded
+(and possibly recompressed) data URI is cached and reused while the file on
+disk is unchanged.
+"""
+
+import functools
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Tuple
+
+# Encoded images are up to ~1MB each; keep the most recently used few
+_MAX_ENTRIES = 16
+
+_cache: "OrderedDict[Tuple[str, int, int, int], str]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def cache_encoded_image(encode: Callable[..., str]) -> Callable[..., str]:
+    """
+    Decorate a client's
+    ``_encode_image_to_base64(image_path, max_size_kb, file_size=None)``.
+
+    Entries are keyed by absolute path, modification time, size and the
+    compression limit, so editing or replacing the file invalidates them
+    without reading its contents. On a miss the size from that stat is
+    passed on as ``file_size``, so the encoder need not stat the file again.
+
+    Args:
+        encode: Method that encodes an image file to a data URI
+
+    Returns:
+        Wrapped method that consults the cache first
+    """
+    @functools.wraps(encode)
+    def wrapper(self, image_path: str, max_size_kb: int = 800) -> str:
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            # Let the encoder report the missing file
+            return encode(self, image_path, max_size_kb)
+
+        key = (os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size, max_size_kb)
+        with _cache_lock:
+            data_uri = _cache.get(key)
+            if data_uri is not None:
+                _cache.move_to_end(key)
+                return data_uri
+
+        data_uri = encode(self, image_path, max_size_kb, file_size=stat.st_size)
+
+        with _cache_lock:
+            _cache[key] = data_uri
+            while len(_cache) > _MAX_ENTRIES:
+                _cache.popitem(last=False)
+        return data_uri
+
+    return wrapper
+
+
+def clear_image_cache() -> None:
+    """Drop all cached encoded images."""
+    with _cache_lock:
+        _cache.clear()
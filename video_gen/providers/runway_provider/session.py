@@ -0,0 +1,194 @@
+"""Shared HTTP session for RunwayML API clients.
+
+All Runway clients send their requests through one ``requests.Session`` so
+task creation, uploads, status polling and downloads reuse keep-alive
+connections instead of opening a new TCP/TLS connection per call.
+"""
+
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Connection pool sizing: hosts cached, and connections kept per host
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 16
+
+# Copy buffer for video downloads; generated clips are tens of megabytes
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> "requests.Session":
+    """
+    Get the process-wide session used by the Runway clients.
+
+    Authentication is sent per request, so one session serves every API key.
+    Retries are left to the clients, which already handle capacity and
+    transient errors themselves.
+
+    Returns:
+        Shared requests.Session with a pooled HTTPS adapter
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def dumps_json(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize a request body, using orjson when it is installed.
+
+    Request payloads carry inline base64 images that run to megabytes;
+    orjson serializes them many times faster than the standard library.
+    Send the result with ``data=`` so requests does not serialize again.
+
+    Args:
+        payload: JSON request payload
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+def loads_json(content: bytes) -> Any:
+    """Parse a response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def download_to_file(url: str, output_path: str, timeout: Union[float, Tuple[float, float]] = 60) -> int:
+    """
+    Stream a response body straight to disk.
+
+    The body is copied from the socket to the file in large blocks, so memory
+    use stays flat regardless of video size and the connection goes back to
+    the pool once the copy finishes.
+
+    Args:
+        url: URL to download
+        output_path: Local path to write
+        timeout: Timeout in seconds, or a (connect, read) pair
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+    """
+    with get_session().get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        # Undo any Content-Encoding the server applied
+        response.raw.decode_content = True
+        with open(output_path, 'wb') as f:
+            _preallocate(f, response)
+            shutil.copyfileobj(response.raw, f, _DOWNLOAD_CHUNK_SIZE)
+            size = f.tell()
+            # Drop any preallocated space the body did not fill
+            f.truncate(size)
+            return size
+
+
+def upload_ephemeral(
+    base_url: str,
+    headers: Dict[str, str],
+    path: Path,
+    mime_type: str,
+    timeout: Union[float, Tuple[float, float]] = (10, 120),
+) -> str:
+    """
+    Upload a local file through Runway's ephemeral uploads endpoint.
+
+    The endpoint returns a presigned form to post the file to and a
+    ``runway://`` URI that task requests accept in place of a data URI. The
+    file goes over the wire as raw bytes in a multipart body, so it needs
+    neither base64 encoding nor recompression to stay under the JSON
+    request size limit.
+
+    Args:
+        base_url: Runway API base URL
+        headers: Authenticated API headers
+        path: File to upload
+        mime_type: MIME type sent with the file
+        timeout: Timeout in seconds, or a (connect, read) pair
+
+    Returns:
+        Runway URI referencing the uploaded file
+
+    Raises:
+        requests.exceptions.RequestException: If either request fails
+        KeyError: If the upload response is missing expected fields
+    """
+    session = get_session()
+    response = session.post(
+        f"{base_url}/uploads",
+        headers=headers,
+        json={"filename": path.name, "type": "ephemeral"},
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    upload = response.json()
+
+    with open(path, 'rb') as f:
+        # The presigned form carries its own credentials; no API headers
+        stored = session.post(
+            upload["uploadUrl"],
+            data=upload.get("fields", {}),
+            files={"file": (path.name, f, mime_type)},
+            timeout=timeout,
+        )
+    stored.raise_for_status()
+    return upload["runwayUri"]
+
+
+def _preallocate(f, response: "requests.Response") -> None:
+    """
+    Reserve disk space for a download whose size is known up front.
+
+    Allocating the whole file before writing lets the filesystem lay it out
+    contiguously instead of extending it chunk by chunk. Skipped where
+    posix_fallocate is unavailable, when the length is unknown, or when the
+    body is compressed and the decoded size is not known.
+
+    Args:
+        f: Output file opened for writing
+        response: Streaming response being downloaded
+    """
+    if not hasattr(os, "posix_fallocate") or response.headers.get("Content-Encoding"):
+        return
+    try:
+        length = int(response.headers.get("Content-Length", 0))
+    except ValueError:
+        return
+    if length > 0:
+        try:
+            os.posix_fallocate(f.fileno(), 0, length)
+        except OSError:
+            # Not supported by this filesystem; the copy works without it
+            pass
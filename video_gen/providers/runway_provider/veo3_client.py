@@ -4,10 +4,11 @@ RunwayML Veo API client with retry logic for video generation.
 Handles API calls for Google Veo models (Veo 3.0, 3.1, 3.1 Fast) via RunwayML.
 """
 
+import re
 import time
 import random
-import base64
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
 try:
@@ -15,10 +16,40 @@ try:
 except ImportError:
     requests = None
 
-from .config import RunwayConfig
+try:
+    # Optional: only needed to compress images over the inline size limit
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from .config import RunwayConfig, PLACEHOLDER_API_KEYS
+from .session import download_to_file, dumps_json, get_session, loads_json, upload_ephemeral
+from .encoding import (
+    compress_jpeg,
+    downscale_to_frame,
+    encode_buffer_data_uri,
+    encode_file_data_uri,
+    exceeds_frame,
+    guess_image_mime_type,
+    repack_jpeg,
+    save_jpeg,
+    shrink_to_box,
+)
+from .image_cache import cache_encoded_image
 from ...exceptions import InsufficientCreditsError
 from ...logger import get_library_logger
-from ...retry_utils import handle_capacity_retry
+from ...retry_utils import calculate_retry_delay, handle_capacity_retry
+
+# Phrases in a 400 response that mean the account is out of credits
+_INSUFFICIENT_CREDITS_RE = re.compile(
+    r"insufficient credits|not enough credit|do not have enough credits", re.IGNORECASE
+)
+
+# Images for one task request are prepared side by side on these threads
+_image_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="runway-images")
+
+# Task states after which polling stops
+_FINISHED_STATUSES = frozenset({"SUCCEEDED", "FAILED", "CANCELLED"})
 
 
 class RunwayVeoClient:
@@ -48,7 +79,7 @@ class RunwayVeoClient:
             )
         
         # Check for placeholder values
-        if self.api_key in ("your_runway_api_key_here", "your_api_key_here", "sk-..."):
+        if self.api_key in PLACEHOLDER_API_KEYS:
             raise ValueError(
                 f"RUNWAY_API_KEY appears to be a placeholder: '{self.api_key}'\n"
                 "Replace it with your actual API key from:\n"
@@ -60,22 +91,29 @@ class RunwayVeoClient:
         self.base_delay = config.retry_base_delay
         self.max_delay = config.retry_max_delay
 
+        # Pooled keep-alive connections shared with the other Runway clients
+        self.session = get_session()
+        # Request headers are fixed for the client's lifetime; build them once
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "X-Runway-Version": "2024-11-06"
+        }
+        # Last ETag and task data per unfinished task, for conditional polls
+        self._task_etags: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
         self.logger.debug("RunwayVeoClient initialized")
 
     def _is_insufficient_credits(self, response_text: str, error_message: Any) -> bool:
-        """Return True if response indicates insufficient credits."""
-        parts = []
-        if error_message is not None:
-            parts.append(str(error_message))
-        if response_text:
-            parts.append(response_text)
-        combined = " ".join(parts).lower()
-        return (
-            "insufficient credits" in combined
-            or "not enough credit" in combined
-            or "not enough credits" in combined
-            or "do not have enough credits" in combined
-        )
+        """
+        Return True if response indicates insufficient credits.
+
+        The parsed error message is checked first; the raw body is only
+        searched when the message doesn't match.
+        """
+        if error_message is not None and _INSUFFICIENT_CREDITS_RE.search(str(error_message)):
+            return True
+        return bool(response_text) and _INSUFFICIENT_CREDITS_RE.search(response_text) is not None
 
     def _get_headers(self) -> Dict[str, str]:
         """
@@ -84,13 +122,56 @@ class RunwayVeoClient:
         Returns:
             Dictionary of HTTP headers
         """
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "X-Runway-Version": "2024-11-06"
-        }
+        return self._headers
+
+    def _prepare_image(self, image_path: str) -> str:
+        """
+        Get the value sent in a task request for a local image.
+
+        With upload_images enabled the raw file is uploaded and referenced by
+        its Runway URI; otherwise, or if the upload fails, it is sent inline
+        as a base64 data URI.
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            Runway URI or data URI for the image
+        """
+        if self.config.upload_images:
+            path = Path(image_path)
+            if not path.exists():
+                raise FileNotFoundError(f"Image file not found: {image_path}")
+            try:
+                return upload_ephemeral(self.config.base_url, self._headers, path, guess_image_mime_type(path))
+            except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+                self.logger.warning("Upload of %s failed, sending it inline: %s", path.name, e)
+        return self._encode_image_to_base64(image_path)
+
+    def _prepare_images(self, image_paths: List[Optional[str]]) -> Dict[str, str]:
+        """
+        Prepare several images for a task request concurrently.
+
+        PIL releases the GIL while compressing and uploads wait on the
+        network, so a keyframe pair plus reference images are prepared side
+        by side instead of back to back.
+
+        Args:
+            image_paths: Image paths; None entries and repeats are skipped
 
-    def _encode_image_to_base64(self, image_path: str, max_size_kb: int = 800) -> str:
+        Returns:
+            Request value (see _prepare_image) keyed by path
+        """
+        unique_paths = list(dict.fromkeys(path for path in image_paths if path))
+        self.logger.debug("Encoding %d images: %s", len(unique_paths), unique_paths)
+        if len(unique_paths) == 1:
+            return {unique_paths[0]: self._prepare_image(unique_paths[0])}
+        return dict(zip(unique_paths, _image_executor.map(self._prepare_image, unique_paths)))
+
+    @cache_encoded_image
+    def _encode_image_to_base64(
+        self, image_path: str, max_size_kb: int = 800, file_size: Optional[int] = None
+    ) -> str:
         """
         Encode an image file to base64 data URI with automatic compression.
         
@@ -100,24 +181,28 @@ class RunwayVeoClient:
         Args:
             image_path: Path to the image file
             max_size_kb: Maximum size in KB before compression (default: 800KB)
+            file_size: Size of the file in bytes if already known, as passed
+                by the image cache; the file is stat'ed otherwise
 
         Returns:
-            Base64 encoded data URI string
+            Base64 encoded data URI string, reused from the image cache while
+            the file is unchanged
         """
         path = Path(image_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Image file not found: {image_path}")
-
-        original_size_kb = path.stat().st_size / 1024
+        if file_size is None:
+            # One stat both checks the file exists and sizes it
+            try:
+                file_size = path.stat().st_size
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Image file not found: {image_path}") from None
+        original_size_kb = file_size / 1024
         
         # Try to use original if small enough
         if original_size_kb <= max_size_kb:
             return self._encode_original_image(path)
         
         # Check if PIL is available for compression
-        try:
-            from PIL import Image as pil_image
-        except ImportError:
+        if Image is None:
             self.logger.warning(
                 f"Image {path.name} is {original_size_kb:.0f}KB (>{max_size_kb}KB) "
                 "but PIL not available for compression. Install: pip install pillow"
@@ -125,33 +210,34 @@ class RunwayVeoClient:
             return self._encode_original_image(path)
         
         # Compress using PIL
-        return self._compress_and_encode_image(path, original_size_kb, max_size_kb, pil_image)
+        return self._compress_and_encode_image(path, original_size_kb, max_size_kb, Image)
     
     def _encode_original_image(self, path: Path) -> str:
         """Encode original image without compression."""
-        import mimetypes
-        
-        mime_type, _ = mimetypes.guess_type(str(path))
-        if not mime_type or not mime_type.startswith('image/'):
-            mime_type = 'image/jpeg'
-        
-        with open(path, 'rb') as f:
-            image_data = f.read()
-        
-        encoded = base64.b64encode(image_data).decode('utf-8')
-        return f"data:{mime_type};base64,{encoded}"
+        # Decoded once here; the ASCII codec is the cheapest for base64 text
+        return encode_file_data_uri(path, guess_image_mime_type(path)).decode('ascii')
     
     def _compress_and_encode_image(self, path: Path, original_size_kb: float, max_size_kb: int, pil_image) -> str:
         """Compress image using PIL and encode to base64."""
-        from io import BytesIO
-        
         self.logger.debug(
             f"Compressing {path.name} ({original_size_kb:.0f}KB) to under {max_size_kb}KB"
         )
         
         img = pil_image.open(path)
+        
+        # Stripping metadata is often enough for JPEGs and loses no quality.
+        # Not tried for JPEGs that get downscaled anyway: repacking decodes
+        # them at full size, where left unloaded they decode at reduced scale
+        if img.format == 'JPEG' and not exceeds_frame(img):
+            result = self._try_lossless_repack(img, path, original_size_kb, max_size_kb)
+            if result:
+                return result
+        
         img = self._convert_to_rgb(img, pil_image)
         
+        if downscale_to_frame(img, pil_image):
+            self.logger.debug("Downscaled %s to %dx%d before compressing", path.name, img.width, img.height)
+        
         # Try progressive quality reduction
         result = self._try_quality_compression(img, path, original_size_kb, max_size_kb)
         if result:
@@ -160,51 +246,59 @@ class RunwayVeoClient:
         # Last resort: resize and compress
         return self._resize_and_compress(img, path, original_size_kb)
     
+    def _try_lossless_repack(self, img, path: Path, original_size_kb: float, max_size_kb: int) -> Optional[str]:
+        """Re-save a JPEG at its original quality without metadata."""
+        buffer = repack_jpeg(img)
+        repacked_size_kb = buffer.tell() / 1024
+        if repacked_size_kb > max_size_kb:
+            return None
+        
+        self.logger.info(
+            f"Repacked {path.name}: {original_size_kb:.0f}KB → {repacked_size_kb:.0f}KB (original quality)"
+        )
+        return encode_buffer_data_uri(buffer, 'image/jpeg').decode('ascii')
+    
     def _convert_to_rgb(self, img, pil_image):
         """Convert image to RGB if necessary."""
         if img.mode in ('RGBA', 'LA', 'P'):
-            background = pil_image.new('RGB', img.size, (255, 255, 255))
             if img.mode == 'P':
                 img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+            alpha = img.getchannel('A')
+            # Fully opaque: drop the alpha channel instead of compositing
+            if alpha.getextrema() == (255, 255):
+                return img.convert('RGB')
+            background = pil_image.new('RGB', img.size, (255, 255, 255))
+            background.paste(img, mask=alpha)
             return background
         return img
     
     def _try_quality_compression(self, img, path: Path, original_size_kb: float, max_size_kb: int) -> Optional[str]:
         """Try compressing with different quality levels."""
-        from io import BytesIO
+        result = compress_jpeg(img, max_size_kb)
+        if result is None:
+            return None
         
-        for quality in [85, 75, 65, 55, 45]:
-            buffer = BytesIO()
-            img.save(buffer, format='JPEG', quality=quality, optimize=True)
-            compressed_size_kb = len(buffer.getvalue()) / 1024
-            
-            if compressed_size_kb <= max_size_kb:
-                self.logger.info(
-                    f"Compressed {path.name}: {original_size_kb:.0f}KB → {compressed_size_kb:.0f}KB "
-                    f"(quality={quality})"
-                )
-                encoded = base64.b64encode(buffer.getvalue()).decode('utf-8')
-                return f"data:image/jpeg;base64,{encoded}"
-        return None
+        buffer, quality = result
+        compressed_size_kb = buffer.tell() / 1024
+        self.logger.info(
+            f"Compressed {path.name}: {original_size_kb:.0f}KB → {compressed_size_kb:.0f}KB "
+            f"(quality={quality})"
+        )
+        return encode_buffer_data_uri(buffer, 'image/jpeg').decode('ascii')
     
     def _resize_and_compress(self, img, path: Path, original_size_kb: float) -> str:
         """Resize image and compress as last resort."""
-        from io import BytesIO
-        
         self.logger.warning(f"Resizing {path.name} to reduce size further")
-        img.thumbnail((1920, 1080))
+        shrink_to_box(img, (1920, 1080), Image)
         
-        buffer = BytesIO()
-        img.save(buffer, format='JPEG', quality=85, optimize=True)
-        final_size_kb = len(buffer.getvalue()) / 1024
+        buffer = save_jpeg(img, 85)
+        final_size_kb = buffer.tell() / 1024
         
         self.logger.info(
             f"Resized and compressed {path.name}: {original_size_kb:.0f}KB → {final_size_kb:.0f}KB"
         )
         
-        encoded = base64.b64encode(buffer.getvalue()).decode('utf-8')
-        return f"data:image/jpeg;base64,{encoded}"
+        return encode_buffer_data_uri(buffer, 'image/jpeg').decode('ascii')
 
     def create_image_to_video_task(
         self,
@@ -278,50 +372,56 @@ class RunwayVeoClient:
                 "Provide either first_frame or at least one reference_image."
             )
         
-        # Encode and add promptImage (required field)
-        self.logger.debug(f"Encoding promptImage: {prompt_image_source}")
-        payload["promptImage"] = self._encode_image_to_base64(prompt_image_source)
+        # Pick the remaining reference images (excluding the one used as promptImage)
+        ref_images_to_use: List[str] = []
+        if reference_images and len(reference_images) > 1:
+            # Use remaining images as reference (skip first if it was used as promptImage and no first_frame)
+            ref_images_to_use = reference_images if first_frame else reference_images[1:]
+            
+            if len(ref_images_to_use) > 3:
+                self.logger.warning(
+                    "Veo supports max 3 reference images, truncating from %d", len(ref_images_to_use)
+                )
+                ref_images_to_use = ref_images_to_use[:3]
+
+        # Encode every image at once rather than one after another
+        images = self._prepare_images([prompt_image_source, first_frame, last_frame, *ref_images_to_use])
+
+        # Add promptImage (required field)
+        payload["promptImage"] = images[prompt_image_source]
         self.logger.info("Added promptImage (source frame)")
 
         # Add first keyframe if provided (for stitching)
         if first_frame:
-            self.logger.debug(f"Encoding firstKeyframe: {first_frame}")
-            payload["firstKeyframe"] = self._encode_image_to_base64(first_frame)
+            payload["firstKeyframe"] = images[first_frame]
             self.logger.info("Added firstKeyframe for stitching")
 
         # Add last keyframe if provided
         if last_frame:
-            self.logger.debug(f"Encoding lastKeyframe: {last_frame}")
-            payload["lastKeyframe"] = self._encode_image_to_base64(last_frame)
+            payload["lastKeyframe"] = images[last_frame]
             self.logger.info("Added lastKeyframe")
 
-        # Add remaining reference images (excluding the one used as promptImage)
-        if reference_images and len(reference_images) > 1:
-            # Use remaining images as reference (skip first if it was used as promptImage and no first_frame)
-            ref_images_to_use = reference_images if first_frame else reference_images[1:]
-            
-            if len(ref_images_to_use) > 3:
-                self.logger.warning(
-                    f"Veo supports max 3 reference images, truncating from {len(ref_images_to_use)}"
-                )
-                ref_images_to_use = ref_images_to_use[:3]
-
-            if ref_images_to_use:
-                self.logger.debug(f"Encoding {len(ref_images_to_use)} reference images")
-                payload["referenceImages"] = [
-                    self._encode_image_to_base64(ref_img) for ref_img in ref_images_to_use
-                ]
-                self.logger.info(f"Added {len(ref_images_to_use)} reference images")
+        if ref_images_to_use:
+            payload["referenceImages"] = [images[ref_img] for ref_img in ref_images_to_use]
+            self.logger.info(f"Added {len(ref_images_to_use)} reference images")
 
         # Make API request with retry logic
         return self._make_request_with_retry(payload)
 
     def _make_request_with_retry(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Make API request with exponential backoff retry logic."""
+        payload_summary = {k: f"<{len(v)} chars>" if isinstance(v, str) and len(v) > 100 
+                          else f"<{len(v)} items>" if isinstance(v, list) 
+                          else v 
+                          for k, v in payload.items()}
+        self.logger.debug(f"Payload structure: {payload_summary}")
+        
+        # Serialized once; retries resend the same body
+        body = dumps_json(payload)
         retry_count = 0
         while True:
             try:
-                response = self._send_request(payload, retry_count)
+                response = self._send_request(body, retry_count)
                 return self._handle_response(response, payload)
             except requests.exceptions.SSLError as e:
                 self._handle_ssl_error(e)
@@ -333,19 +433,13 @@ class RunwayVeoClient:
                 self.logger.error(f"RunwayML API error: {e}")
                 raise RuntimeError(f"RunwayML API request failed: {e}")
     
-    def _send_request(self, payload: Dict[str, Any], retry_count: int):
-        """Send API request with logging."""
+    def _send_request(self, body: bytes, retry_count: int):
+        """Send the serialized API request with logging."""
         self.logger.debug(f"Sending RunwayML API request (attempt {retry_count + 1})")
-        payload_summary = {k: f"<{len(v)} chars>" if isinstance(v, str) and len(v) > 100 
-                          else f"<{len(v)} items>" if isinstance(v, list) 
-                          else v 
-                          for k, v in payload.items()}
-        self.logger.debug(f"Payload structure: {payload_summary}")
-        
-        return requests.post(
+        return self.session.post(
             f"{self.base_url}/image_to_video",
             headers=self._get_headers(),
-            json=payload,
+            data=body,
             timeout=30
         )
     
@@ -478,13 +572,91 @@ class RunwayVeoClient:
         """
         handle_capacity_retry(retry_count, self.config, self.logger)
 
-    def poll_task(self, task_id: str, poll_interval: int = 5) -> Dict[str, Any]:
+    def _get_poll_delay(self, poll_count: int, poll_interval: float) -> float:
+        """
+        Get the wait before the next status check.
+
+        Doubles from poll_interval up to config.poll_max_interval, with jitter
+        so concurrent tasks don't poll in lockstep.
+
+        Args:
+            poll_count: Number of status checks made so far
+            poll_interval: Delay before the first check
+
+        Returns:
+            Delay in seconds
+        """
+        return calculate_retry_delay(
+            poll_count + 1,
+            poll_interval,
+            max(poll_interval, self.config.poll_max_interval),
+            self.config.retry_jitter_percent
+        )
+
+    def _get_task(self, task_id: str) -> Dict[str, Any]:
+        """
+        Fetch the current state of a task.
+
+        Polls are conditional on the ETag of the previous response, so a
+        task that has not changed comes back as an empty 304 and the last
+        parsed data is reused.
+
+        Args:
+            task_id: The task ID to look up
+
+        Returns:
+            Parsed task data
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails or
+                the body is not valid JSON
+        """
+        headers = self._get_headers()
+        cached = self._task_etags.get(task_id)
+        if cached is not None:
+            headers = {**headers, "If-None-Match": cached[0]}
+
+        response = self.session.get(
+            f"{self.base_url}/tasks/{task_id}",
+            headers=headers,
+            timeout=10
+        )
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+        response.raise_for_status()
+        try:
+            task_data = loads_json(response.content)
+        except ValueError as e:
+            # Keep a garbled body retryable, as response.json() errors were
+            raise requests.exceptions.InvalidJSONError(
+                f"Invalid JSON response from RunwayML: {e}", response=response
+            ) from e
+
+        etag = response.headers.get("ETag")
+        if etag and task_data.get("status") not in _FINISHED_STATUSES:
+            self._task_etags[task_id] = (etag, task_data)
+        else:
+            self._task_etags.pop(task_id, None)
+        return task_data
+
+    def poll_task(
+        self,
+        task_id: str,
+        poll_interval: Optional[float] = None,
+        initial_delay: float = 0
+    ) -> Dict[str, Any]:
         """
         Poll a task until it completes.
 
+        The wait between checks starts at poll_interval and backs off
+        exponentially, so long generations cost a handful of requests.
+
         Args:
             task_id: The task ID to poll
-            poll_interval: Seconds between polling attempts
+            poll_interval: Seconds before the first re-check. Defaults to
+                config.poll_base_interval.
+            initial_delay: Seconds to wait before the first check, for tasks
+                that cannot finish sooner
 
         Returns:
             Final task response with output
@@ -492,15 +664,17 @@ class RunwayVeoClient:
         Raises:
             RuntimeError: If task fails or polling fails
         """
+        if poll_interval is None:
+            poll_interval = self.config.poll_base_interval
+        if initial_delay > 0:
+            time.sleep(initial_delay)
+
+        poll_count = 0
         while True:
+            delay = self._get_poll_delay(poll_count, poll_interval)
+            poll_count += 1
             try:
-                response = requests.get(
-                    f"{self.base_url}/tasks/{task_id}",
-                    headers=self._get_headers(),
-                    timeout=10
-                )
-                response.raise_for_status()
-                task_data = response.json()
+                task_data = self._get_task(task_id)
 
                 status = task_data.get("status")
 
@@ -512,7 +686,7 @@ class RunwayVeoClient:
                     raise RuntimeError(f"RunwayML task failed: {error_msg}")
 
                 # Otherwise keep polling
-                time.sleep(poll_interval)
+                time.sleep(delay)
                 continue
 
             except requests.exceptions.SSLError as e:
@@ -527,11 +701,11 @@ class RunwayVeoClient:
                         f"Original error: {error_msg}"
                     )
                 # Other SSL errors, retry
-                time.sleep(poll_interval)
+                time.sleep(delay)
                 continue
 
             except requests.exceptions.RequestException:
-                time.sleep(poll_interval)
+                time.sleep(delay)
                 continue
 
     def download_video(self, url: str, output_path: str) -> str:
@@ -549,13 +723,7 @@ class RunwayVeoClient:
             RuntimeError: If download fails including SSL errors
         """
         try:
-            response = requests.get(url, stream=True, timeout=60)
-            response.raise_for_status()
-
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-
+            download_to_file(url, output_path, timeout=60)
             return output_path
 
         except requests.exceptions.SSLError as e:
@@ -619,8 +787,8 @@ class RunwayVeoClient:
         if not task_id:
             raise RuntimeError("No task ID in response")
 
-        # Poll until complete
-        completed_task = self.poll_task(task_id)
+        # Poll until complete; a clip takes at least its own length to render
+        completed_task = self.poll_task(task_id, initial_delay=duration)
 
         # Get output URL
         output_urls = completed_task.get("output", [])
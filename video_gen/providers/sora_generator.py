@@ -62,7 +62,7 @@ def generate_video_with_sora2(
     
     The function implements exponential backoff retry logic for capacity issues,
     starting with 30-second delays and increasing up to 5 minutes between retries.
-    It will retry indefinitely until the API becomes available or the user cancels.
+    It gives up after config.max_retries retries (default 3) or when the user cancels.
     
     Args:
         prompt: Text description of the desired video content
@@ -80,7 +80,7 @@ def generate_video_with_sora2(
         Path to the saved video file
         
     Raises:
-        RuntimeError: If API calls fail (non-capacity issues) or video generation fails
+        RuntimeError: If API calls fail, capacity retries are exhausted, or video generation fails
         FileNotFoundError: If reference image files don't exist
         ValueError: If file types are unsupported
         KeyboardInterrupt: If user cancels during retry backoff
@@ -8,7 +8,8 @@ across provider implementations.
 import time
 import random
 import logging
-from typing import Protocol
+import threading
+from typing import Optional, Protocol
 
 
 class RetryConfig(Protocol):
@@ -22,60 +23,88 @@ def calculate_retry_delay(
     retry_count: int,
     base_delay: int = 30,
     max_delay: int = 300,
-    jitter_percent: float = 0.2
+    jitter_percent: float = 0.2,
+    server_hint: Optional[float] = None
 ) -> float:
     """
     Calculate exponential backoff delay with jitter.
     
+    When the server says how long to wait (e.g. a Retry-After header), that
+    value is used instead of the exponential schedule, capped at max_delay.
+    Jitter is then only added on top so the retry never fires early.
+    
     Args:
         retry_count: Current retry attempt number (1-indexed)
         base_delay: Initial delay in seconds
         max_delay: Maximum delay cap in seconds
         jitter_percent: Percentage of jitter to add (±)
+        server_hint: Delay in seconds requested by the server, if any
         
     Returns:
         Calculated delay in seconds with jitter applied
     """
+    if server_hint is not None and server_hint >= 0:
+        delay = min(server_hint, max_delay)
+        return max(1, delay + delay * jitter_percent * random.random())
+    
     # Exponential backoff with cap at attempt 4 (2^4 = 16x base)
     delay = min(
         base_delay * (2 ** min(retry_count - 1, 4)),
         max_delay
     )
     
-    # Add random jitter to avoid thundering herd
-    jitter = delay * jitter_percent * (random.random() - 0.5)
-    actual_delay = max(1, delay + jitter)
-    
-    return actual_delay
+    # Scale by a random factor around 1 to avoid thundering herd
+    return max(1, delay * (1 + jitter_percent * (random.random() - 0.5)))
 
 
 def handle_capacity_retry(
     retry_count: int,
     config: RetryConfig,
-    logger: logging.Logger
-) -> None:
+    logger: logging.Logger,
+    server_hint: Optional[float] = None,
+    delay_budget: Optional[float] = None,
+    cancel_event: Optional[threading.Event] = None
+) -> float:
     """
     Handle capacity retry with exponential backoff and user cancellation.
     
+    When a cancel_event is given the backoff waits on it instead of sleeping,
+    so another thread can abort the retry immediately by setting the event.
+    
     Args:
         retry_count: Current retry attempt number
         config: Configuration object with retry settings
         logger: Logger instance for output
+        server_hint: Delay in seconds requested by the server, if any
+        delay_budget: Remaining wait time allowed across all retries, if capped
+        cancel_event: Event that cancels the wait when set
+        
+    Returns:
+        Number of seconds waited
         
     Raises:
-        RuntimeError: If user cancels during backoff (Ctrl+C)
+        RuntimeError: If user cancels during backoff (Ctrl+C) or cancel_event is set
     """
     actual_delay = calculate_retry_delay(
         retry_count,
         config.retry_base_delay,
         config.retry_max_delay,
-        config.retry_jitter_percent
+        config.retry_jitter_percent,
+        server_hint
     )
+    if delay_budget is not None:
+        actual_delay = max(0, min(actual_delay, delay_budget))
     
     logger.info(f"Waiting {actual_delay:.1f}s before retry {retry_count}...")
     
     try:
-        time.sleep(actual_delay)
+        if cancel_event is None:
+            time.sleep(actual_delay)
+        elif cancel_event.wait(actual_delay):
+            logger.warning("Retry cancelled")
+            raise RuntimeError("Operation cancelled")
     except KeyboardInterrupt:
         logger.warning("Operation cancelled by user")
         raise RuntimeError("Operation cancelled by user")
+    
+    return actual_delay